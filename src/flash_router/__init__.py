@@ -1,3 +1,4 @@
 from .components import RootContainer, ChildContainer, SlotContainer
 from .router import Router as FlashRouter
-from .core.routing import RouteConfig
+from .core.routing import EndpointCacheConfig, FragmentCacheConfig, RouteConfig
+from .core.deadlines import remaining_time
@@ -0,0 +1,69 @@
+import json
+
+from .components import RootContainer
+
+
+RESOLVE_ROUTE = "_flash_router/resolve"
+
+
+_APPLY_RESPONSE = """
+    const apply = (payload) => {
+        for (const [id, props] of Object.entries(payload.response || {})) {
+            dash_clientside.set_props(id.startsWith("{") ? JSON.parse(id) : id, props);
+        }
+    };"""
+
+_READ_JSON = """
+    apply(await response.json());"""
+
+# Newline delimited responses are applied as soon as each line arrived
+_READ_NDJSON = """
+    const reader = response.body.getReader();
+    const decoder = new TextDecoder();
+    let buffer = "";
+    while (true) {
+        const {done, value} = await reader.read();
+        buffer += decoder.decode(value || new Uint8Array(), {stream: !done});
+        const lines = buffer.split("\\n");
+        buffer = done ? "" : lines.pop();
+        for (const line of lines) {
+            if (line.trim()) {
+                apply(JSON.parse(line));
+            }
+        }
+        if (done) {
+            break;
+        }
+    }"""
+
+
+def resolve_handler(url: str, input_names: list[str], stream: bool = False) -> str:
+    """
+    Clientside callback that posts location changes to the resolve endpoint
+    and applies the returned component updates with ``set_props``. With
+    ``stream`` the endpoint answers with one JSON response per line.
+    """
+    return f"""
+async function(pathname, search, state, ...values) {{
+    const triggered = dash_clientside.callback_context.triggered || [];
+    const [componentId, trigger] = triggered.length ? triggered[0].prop_id.split(".") : [];
+    if (componentId !== {json.dumps(RootContainer.ids.location)} ||
+        !["pathname", "search"].includes(trigger)) {{
+        return dash_clientside.no_update;
+    }}
+
+    const names = {json.dumps(input_names)};
+    const inputs = Object.fromEntries(names.map((name, index) => [name, values[index]]));
+    const response = await fetch({json.dumps(url)}, {{
+        method: "POST",
+        headers: {{"Content-Type": "application/json"}},
+        body: JSON.stringify({{pathname, search, state, trigger, inputs}}),
+    }});
+    if (!response.ok) {{
+        throw new Error(`Failed to resolve the URL (${{response.status}})`);
+    }}
+{_APPLY_RESPONSE}
+{_READ_NDJSON if stream else _READ_JSON}
+    return dash_clientside.no_update;
+}}
+"""
@@ -0,0 +1,48 @@
+from __future__ import annotations
+
+from collections.abc import Callable, Awaitable
+from contextvars import ContextVar
+import asyncio
+import time
+
+from ..types import EndpointResult
+
+
+_deadline: ContextVar[float | None] = ContextVar("flash_router_deadline", default=None)
+
+
+def remaining_time() -> float | None:
+    """
+    Seconds left for the running endpoint, the earlier of its route timeout
+    and the request deadline. None without either. Pass it on as the timeout
+    of backend calls made by the endpoint.
+    """
+    deadline = _deadline.get()
+    if deadline is None:
+        return None
+    return max(deadline - time.monotonic(), 0.0)
+
+
+async def call_with_deadline(
+    call: Callable[[], Awaitable[EndpointResult]],
+    timeout: float | None,
+    deadline: float | None,
+    name: str,
+) -> EndpointResult:
+    """Await an endpoint within its timeout and the request deadline (monotonic time)"""
+    now = time.monotonic()
+    if timeout is not None:
+        deadline = now + timeout if deadline is None else min(deadline, now + timeout)
+    if deadline is None:
+        return await call()
+
+    token = _deadline.set(deadline)
+    try:
+        async with asyncio.timeout(deadline - now) as scope:
+            return await call()
+    except TimeoutError:
+        if scope.expired():
+            raise TimeoutError(f"Endpoint of {name} did not finish in time") from None
+        raise
+    finally:
+        _deadline.reset(token)
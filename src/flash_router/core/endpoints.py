@@ -0,0 +1,266 @@
+from __future__ import annotations
+
+from collections import OrderedDict
+from collections.abc import Callable, Mapping
+from dataclasses import dataclass
+from functools import cache, partial
+from typing import Any, NamedTuple
+import asyncio
+import inspect
+import json
+import sys
+import time
+
+from pydantic import BaseModel
+
+from .query_params import extract_function_inputs
+from .routing import EndpointCacheConfig, RouteRegistry, RoutingContext
+from ..types import Endpoint, EndpointResult
+from ..utils.serialization import dumps
+
+
+@cache
+def endpoint_input_names(
+    endpoint: Callable[..., Any], exclude: frozenset[str] = frozenset()
+) -> tuple[str, ...]:
+    """
+    Inputs an endpoint result depends on: the inputs found by
+    extract_function_inputs and the named parameters without annotation.
+    Keywords receiving the results of other endpoints are excluded.
+    """
+    inputs, _ = extract_function_inputs(endpoint, exclude)
+    names = set(inputs)
+    for name, parameter in inspect.signature(endpoint).parameters.items():
+        if parameter.kind not in (parameter.VAR_POSITIONAL, parameter.VAR_KEYWORD):
+            names.add(name)
+    return tuple(sorted(names - exclude))
+
+
+def _estimate_size(result: Any) -> int:
+    """
+    Size of the result as JSON. Nested rows are counted, unlike with
+    sys.getsizeof, which only measures the outer container.
+    """
+    try:
+        if isinstance(result, BaseModel):
+            return len(result.model_dump_json())
+        return len(dumps(result))
+    except Exception:
+        return sys.getsizeof(result)
+
+
+class SingleFlightInfo(NamedTuple):
+    calls: int
+    coalesced: int
+    in_flight: int
+
+
+class SingleFlight:
+    """
+    Process wide coalescing of endpoint calls. Callers with the key of a call
+    that is still running await its result instead of starting their own.
+    A cancelled caller does not cancel the call for the others.
+    """
+
+    def __init__(self) -> None:
+        self.calls = 0
+        self.coalesced = 0
+        self._in_flight: dict[str, asyncio.Future[EndpointResult]] = {}
+
+    async def call(self, key: str, endpoint: Endpoint, **dependency_results: Any) -> EndpointResult:
+        future = self._in_flight.get(key)
+        if future is not None and future.get_loop() is asyncio.get_running_loop():
+            self.coalesced += 1
+            return await asyncio.shield(future)
+
+        self.calls += 1
+        future = asyncio.ensure_future(endpoint(**dependency_results))
+        self._in_flight[key] = future
+        future.add_done_callback(lambda _: self._forget(key, future))
+        return await asyncio.shield(future)
+
+    def _forget(self, key: str, future: asyncio.Future[EndpointResult]) -> None:
+        if self._in_flight.get(key) is future:
+            del self._in_flight[key]
+
+    def info(self) -> SingleFlightInfo:
+        return SingleFlightInfo(self.calls, self.coalesced, len(self._in_flight))
+
+    def reset(self) -> None:
+        self.calls = 0
+        self.coalesced = 0
+
+
+single_flight = SingleFlight()
+
+
+@dataclass(slots=True)
+class CachedResult:
+    result: Any
+    stored_at: float
+    size: int
+
+
+class EndpointCacheInfo(NamedTuple):
+    hits: int
+    stale_hits: int
+    misses: int
+    currsize: int
+    nbytes: int
+    maxbytes: int
+
+
+class EndpointCache:
+    """
+    Results of endpoints with an ``endpoint_cache`` config, bounded by the
+    estimated size of the results (least recently used are evicted first).
+    Raised or returned exceptions are never stored.
+    """
+
+    def __init__(
+        self,
+        maxbytes: int = 64 * 2**20,
+        session_id: Callable[[], str | None] | None = None,
+    ) -> None:
+        self.maxbytes = maxbytes
+        self.session_id = session_id
+        self.hits = 0
+        self.stale_hits = 0
+        self.misses = 0
+        self._results: OrderedDict[str, CachedResult] = OrderedDict()
+        self._nbytes = 0
+        self._refreshing: dict[str, asyncio.Task[None]] = {}
+        self._generation = RouteRegistry.generation()
+
+    def attach(self, ctx: RoutingContext, single_flight: SingleFlight | None = None) -> None:
+        """
+        Replace the endpoints of cached routes in the context with cached calls.
+        With ``single_flight`` every endpoint call is coalesced with identical
+        calls in flight, cache misses included. Attached once per request,
+        endpoints that are wrapped already are skipped as their keys would
+        miss the endpoint inputs.
+        """
+        generation = RouteRegistry.generation()
+        if generation != self._generation:
+            self.clear()
+            self._generation = generation
+
+        for node_id, endpoint in ctx.endpoints.items():
+            route = RouteRegistry.get_node(node_id)
+            config = route.endpoint_cache if route else None
+            if (config is None and single_flight is None) or not isinstance(endpoint, partial):
+                continue
+            if isinstance(getattr(endpoint.func, "__self__", None), (EndpointCache, SingleFlight)):
+                continue
+
+            dependencies = ctx.endpoint_dependencies.get(node_id, {})
+            key = self.create_key(node_id, config, endpoint, dependencies)
+            if key is None:
+                continue
+
+            call = partial(single_flight.call, key, endpoint) if single_flight else endpoint
+            ctx.endpoints[node_id] = partial(self.call, key, config, call) if config else call
+
+    def create_key(
+        self,
+        node_id: str,
+        config: EndpointCacheConfig | None,
+        endpoint: partial[Any],
+        dependencies: Mapping[str, str] | None = None,
+    ) -> str | None:
+        """
+        Node id, session and the values of the endpoint inputs, including the
+        inputs of the endpoints it depends on. None if the session is unknown.
+        """
+        session = None
+        if config is not None and config.vary_by_session:
+            session = self.session_id() if self.session_id else None
+            # Results of one session must never be served to another
+            if session is None:
+                return None
+
+        names = set(endpoint_input_names(endpoint.func, frozenset(dependencies or ())))
+        for dependency_id in (dependencies or {}).values():
+            dependency = RouteRegistry.get_node(dependency_id)
+            if dependency is not None and dependency.endpoint is not None:
+                names.update(
+                    endpoint_input_names(dependency.endpoint, frozenset(dependency.endpoint_depends))
+                )
+
+        variables = endpoint.keywords
+        values = {name: variables.get(name) for name in sorted(names)}
+        return json.dumps([node_id, session, values], default=str)
+
+    async def call(
+        self, key: str, config: EndpointCacheConfig, endpoint: Endpoint, **dependency_results: Any
+    ) -> EndpointResult:
+        if dependency_results:
+            endpoint = partial(endpoint, **dependency_results)
+
+        entry = self._results.get(key)
+        if entry is not None:
+            age = time.monotonic() - entry.stored_at
+            if age < config.ttl:
+                self.hits += 1
+                self._results.move_to_end(key)
+                return entry.result
+
+            if age < config.ttl + config.stale_while_revalidate:
+                self.stale_hits += 1
+                self._results.move_to_end(key)
+                self._revalidate(key, endpoint)
+                return entry.result
+
+        self.misses += 1
+        result = await endpoint()
+        self.store(key, result)
+        return result
+
+    def store(self, key: str, result: Any) -> None:
+        self._discard(key)
+        if isinstance(result, BaseException):
+            return
+
+        size = _estimate_size(result)
+        if size > self.maxbytes:
+            return
+
+        self._results[key] = CachedResult(result, time.monotonic(), size)
+        self._nbytes += size
+        while self._nbytes > self.maxbytes:
+            _, evicted = self._results.popitem(last=False)
+            self._nbytes -= evicted.size
+
+    def _discard(self, key: str) -> None:
+        entry = self._results.pop(key, None)
+        if entry is not None:
+            self._nbytes -= entry.size
+
+    def _revalidate(self, key: str, endpoint: Endpoint) -> None:
+        """Refresh a stale result in the background, once per key at a time"""
+        if key in self._refreshing:
+            return
+
+        task = asyncio.ensure_future(self._refresh(key, endpoint))
+        self._refreshing[key] = task
+        task.add_done_callback(lambda _: self._refreshing.pop(key, None))
+
+    async def _refresh(self, key: str, endpoint: Endpoint) -> None:
+        try:
+            result = await endpoint()
+        except Exception:
+            # The stale result stays until its grace period is over
+            return
+        self.store(key, result)
+
+    def info(self) -> EndpointCacheInfo:
+        return EndpointCacheInfo(
+            self.hits, self.stale_hits, self.misses, len(self._results), self._nbytes, self.maxbytes
+        )
+
+    def clear(self) -> None:
+        self._results.clear()
+        self._nbytes = 0
+        self.hits = 0
+        self.stale_hits = 0
+        self.misses = 0
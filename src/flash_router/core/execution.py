@@ -1,16 +1,22 @@
 from __future__ import annotations
 
 from dash.development.base_component import Component
+from collections.abc import Iterator
 from dataclasses import dataclass, field
-from typing import Any, Literal
+from typing import TYPE_CHECKING, Any, Literal
 from dash import html
 import asyncio
+import json
 
 
 from ..utils.helper_functions import _invoke_layout
-from ..types import ErrorLayout, Layout, EndpointResults, PathVariables, QueryParams
+from ..utils.serialization import Fragment
+from ..types import ErrorLayout, Layout, EndpointResult, EndpointResults, PathVariables, QueryParams
 from ..components import ChildContainer, LacyContainer, SlotContainer
 
+if TYPE_CHECKING:
+    from .fragments import FragmentSlot
+
 
 @dataclass
 class ExecNode:
@@ -26,12 +32,27 @@ class ExecNode:
     loading: Layout  | None = None
     error: ErrorLayout | None = None
     is_lacy: bool = False
-
-    async def execute(self, endpoint_results: EndpointResults) -> Component:
+    # Cached serialized subtree, replaces the execution of the whole subtree
+    fragment: Fragment | None = None
+    fragment_slot: "FragmentSlot | None" = None
+    failed: bool = False
+
+    def walk(self) -> Iterator["ExecNode"]:
+        """The node and all nodes of its subtree"""
+        yield self
+        for slot in self.slots.values():
+            yield from slot.walk()
+        if isinstance(self.child_node, ExecNode):
+            yield from self.child_node.walk()
+
+    async def execute(self, endpoint_results: EndpointResults) -> Component | Fragment:
         """
         Executes the node by rendering its layout with the provided variables,
         slots, and views.
         """
+        if self.fragment is not None:
+            return self.fragment
+
         data = endpoint_results.get(self.node_id)
 
         if self.is_lacy:
@@ -56,9 +77,66 @@ class ExecNode:
         except Exception as e:
             layout = await self.handle_error(e, self.variables)
 
+        # Error layouts are never cached
+        if self.fragment_slot is not None and not any(node.failed for node in self.walk()):
+            return self.fragment_slot.store(layout)
+
         return layout
 
+    async def stream(
+        self,
+        container_id: str,
+        endpoint_futures: dict[str, asyncio.Future[EndpointResult]],
+        queue: asyncio.Queue[tuple[str, Component]],
+    ) -> None:
+        """
+        Render the node with empty slot and child containers as soon as its own
+        endpoint resolved and push it to the queue, then stream the subtrees
+        concurrently. A node is always queued before its descendants.
+        Cached subtrees are queued at once, subtrees are not stored here.
+        """
+        if self.fragment is not None:
+            await queue.put((container_id, self.fragment))
+            return
+
+        if self.is_lacy:
+            await queue.put((container_id, await self.execute({})))
+            return
+
+        endpoint_future = endpoint_futures.get(self.node_id)
+        data = await endpoint_future if endpoint_future else None
+
+        if isinstance(data, Exception):
+            await queue.put((container_id, await self.handle_error(data, self.variables)))
+            return
+
+        placeholders = {
+            slot_name.strip("()"): SlotContainer(None, self.node_id, slot_name)
+            for slot_name in self.slots
+        }
+        child_segment = self.child_node.segment if isinstance(self.child_node, ExecNode) else None
+        placeholders["children"] = ChildContainer(None, self.node_id, child_segment)
+
+        try:
+            layout = await _invoke_layout(self.layout, **{**self.variables, **placeholders, "data": data}) # pyright: ignore[reportArgumentType]
+        except Exception as e:
+            await queue.put((container_id, await self.handle_error(e, self.variables)))
+            return
+
+        await queue.put((container_id, layout))
+
+        subtrees = [
+            slot.stream(json.dumps(SlotContainer.ids.container(self.node_id, slot_name)), endpoint_futures, queue)
+            for slot_name, slot in self.slots.items()
+        ]
+        if isinstance(self.child_node, ExecNode):
+            subtrees.append(self.child_node.stream(
+                json.dumps(ChildContainer.ids.container(self.node_id)), endpoint_futures, queue
+            ))
+        _ = await asyncio.gather(*subtrees)
+
     async def handle_error(self, error: Exception, variables: dict[str, Any]):
+        self.failed = True
         if not self.error:
             return html.Div(str(error), className="banner")
 
@@ -0,0 +1,185 @@
+from __future__ import annotations
+
+from collections.abc import Callable
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+from functools import partial, wraps
+from typing import Any, TypeVar
+import asyncio
+import contextvars
+import copy
+import inspect
+import multiprocessing
+import pickle
+import threading
+import uuid
+
+from .modules import RouteModuleCache
+from ..components import ChildContainer, SlotContainer
+from ..types import ExecutionMode
+from ..utils.serialization import Fragment, dumps
+
+
+F = TypeVar("F", bound=Callable[..., Any])
+
+
+# Route modules imported by a process pool worker, keyed by file like in the router
+_worker_modules = RouteModuleCache()
+
+
+def _render_in_process(
+    route_files: list[tuple[str, str]],
+    attribute: str,
+    payload: bytes,
+    typed_array_threshold: int | None,
+) -> bytes:
+    """
+    Process pool task: import the route files, call the layout with the
+    unpickled arguments and return the serialized component tree. Route
+    modules are imported before unpickling, so endpoint data models defined
+    in ``api.py`` resolve in spawned workers too.
+    """
+    modules = [_worker_modules.load(module_name, file_path) for module_name, file_path in route_files]
+    layout = getattr(modules[0], attribute)
+    kwargs = pickle.loads(payload)
+    if inspect.iscoroutinefunction(layout):
+        component = asyncio.run(layout(**kwargs))
+    else:
+        component = layout(**kwargs)
+    return dumps(component, typed_array_threshold=typed_array_threshold)
+
+
+def _detach_containers(
+    kwargs: dict[str, Any], typed_array_threshold: int | None
+) -> tuple[dict[str, Any], dict[bytes, bytes]]:
+    """
+    Replace the content of slot and child containers with unique markers.
+    The content is serialized here and spliced into the result of the
+    worker, rendered subtrees never cross the process boundary.
+    """
+    detached = dict(kwargs)
+    fragments: dict[bytes, bytes] = {}
+    for name, value in kwargs.items():
+        if not isinstance(value, (SlotContainer, ChildContainer)) or value.children is None:
+            continue
+        marker = f"flash-router-fragment-{uuid.uuid4().hex}"
+        fragments[f'"{marker}"'.encode()] = dumps(value.children, typed_array_threshold)
+        container = copy.copy(value)
+        container.children = marker
+        detached[name] = container
+    return detached, fragments
+
+
+class SyncExecutor:
+    """
+    Runs layouts and endpoints off the event loop. Synchronous callables use
+    a bounded thread pool, layouts of routes in process mode a process pool.
+    Pools are created on first use, so a router built before fork does not
+    carry them into the workers.
+    """
+
+    def __init__(
+        self,
+        max_workers: int | None = None,
+        process_workers: int | None = None,
+        typed_array_threshold: int | None = None,
+    ) -> None:
+        self.max_workers = max_workers
+        self.process_workers = process_workers
+        self.typed_array_threshold = typed_array_threshold
+        self._pool: ThreadPoolExecutor | None = None
+        self._process_pool: ProcessPoolExecutor | None = None
+        self._lock = threading.Lock()
+
+    @property
+    def pool(self) -> ThreadPoolExecutor:
+        if self._pool is None:
+            with self._lock:
+                if self._pool is None:
+                    self._pool = ThreadPoolExecutor(
+                        max_workers=self.max_workers, thread_name_prefix="flash-router"
+                    )
+        return self._pool
+
+    @property
+    def process_pool(self) -> ProcessPoolExecutor:
+        if self._process_pool is None:
+            with self._lock:
+                if self._process_pool is None:
+                    # Forking a server with running threads may deadlock the child
+                    self._process_pool = ProcessPoolExecutor(
+                        max_workers=self.process_workers,
+                        mp_context=multiprocessing.get_context("spawn"),
+                    )
+        return self._process_pool
+
+    async def run(self, func: Callable[..., Any], /, *args: Any, **kwargs: Any) -> Any:
+        """Call ``func`` on the pool with the context (e.g. the deadline) of the caller"""
+        context = contextvars.copy_context()
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(self.pool, partial(context.run, func, *args, **kwargs))
+
+    def wrap(self, func: F | None, mode: ExecutionMode, awaitable: bool = False) -> F | None:
+        """
+        Coroutine function running a synchronous ``func`` in the given mode.
+        Inline layouts stay untouched, inline endpoints (``awaitable``) are
+        wrapped since endpoints are always awaited.
+        """
+        if not inspect.isfunction(func) or inspect.iscoroutinefunction(func):
+            return func
+
+        # Only page layouts are rendered in processes, see wrap_process
+        if mode in ("thread", "process"):
+
+            @wraps(func)
+            async def run_in_thread(*args: Any, **kwargs: Any) -> Any:
+                return await self.run(func, *args, **kwargs)
+
+            return run_in_thread # pyright: ignore[reportReturnType]
+
+        if awaitable:
+
+            @wraps(func)
+            async def run_inline(*args: Any, **kwargs: Any) -> Any:
+                return func(*args, **kwargs)
+
+            return run_inline # pyright: ignore[reportReturnType]
+
+        return func
+
+    def wrap_process(
+        self, func: F, route_files: list[tuple[str, str]], attribute: str = "layout"
+    ) -> F:
+        """
+        Coroutine function rendering the layout ``attribute`` of the first
+        route file in the process pool. Arguments have to be picklable, the
+        result is a Fragment with the serialized component tree.
+        """
+        if not inspect.isfunction(func):
+            return func
+
+        @wraps(func)
+        async def render_in_process(**kwargs: Any) -> Fragment:
+            detached, fragments = _detach_containers(kwargs, self.typed_array_threshold)
+            loop = asyncio.get_running_loop()
+            rendered = await loop.run_in_executor(
+                self.process_pool,
+                _render_in_process,
+                route_files,
+                attribute,
+                pickle.dumps(detached),
+                self.typed_array_threshold,
+            )
+            for marker, fragment in fragments.items():
+                rendered = rendered.replace(marker, fragment, 1)
+            return Fragment(rendered)
+
+        return render_in_process # pyright: ignore[reportReturnType]
+
+    def shutdown(self) -> None:
+        with self._lock:
+            if self._pool is not None:
+                self._pool.shutdown(wait=False)
+                self._pool = None
+            if self._process_pool is not None:
+                self._process_pool.shutdown(wait=False)
+                self._process_pool = None
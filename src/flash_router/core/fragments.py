@@ -0,0 +1,140 @@
+from __future__ import annotations
+
+from collections import OrderedDict
+from dataclasses import dataclass
+from typing import Any, NamedTuple
+import json
+import time
+
+from dash.development.base_component import Component
+
+from .execution import ExecNode
+from .routing import FragmentCacheConfig, RouteRegistry, RoutingContext
+from ..utils.serialization import Fragment, dumps
+
+
+class FragmentCacheInfo(NamedTuple):
+    hits: int
+    misses: int
+    maxsize: int
+    currsize: int
+
+
+@dataclass(frozen=True, slots=True)
+class FragmentSlot:
+    """Cache entry a rendered subtree is stored to"""
+
+    cache: "FragmentCache"
+    key: str
+    ttl: float | None
+
+    def store(self, layout: Component) -> Fragment:
+        return self.cache.put(self.key, layout, self.ttl)
+
+
+class FragmentCache:
+    """
+    Bounded LRU of rendered subtrees of routes with a ``fragment_cache``
+    config. Subtrees are kept as serialized JSON and spliced into the
+    response as is, endpoints of a cached subtree are not called.
+    """
+
+    def __init__(self, maxsize: int = 1024, typed_array_threshold: int | None = None) -> None:
+        self.maxsize = maxsize
+        self.typed_array_threshold = typed_array_threshold
+        self.hits = 0
+        self.misses = 0
+        self._fragments: OrderedDict[str, tuple[Fragment, float | None]] = OrderedDict()
+        self._generation = RouteRegistry.generation()
+
+    def get(self, key: str) -> Fragment | None:
+        entry = self._fragments.get(key)
+        if entry is None:
+            self.misses += 1
+            return None
+
+        fragment, expires_at = entry
+        if expires_at is not None and expires_at <= time.monotonic():
+            del self._fragments[key]
+            self.misses += 1
+            return None
+
+        self.hits += 1
+        self._fragments.move_to_end(key)
+        return fragment
+
+    def put(self, key: str, layout: Component, ttl: float | None) -> Fragment:
+        """Serialize the layout once and return the fragment that replaces it"""
+        fragment = Fragment(dumps(layout, typed_array_threshold=self.typed_array_threshold))
+        if self.maxsize > 0:
+            expires_at = time.monotonic() + ttl if ttl is not None else None
+            self._fragments[key] = (fragment, expires_at)
+            self._fragments.move_to_end(key)
+            if len(self._fragments) > self.maxsize:
+                _ = self._fragments.popitem(last=False)
+        return fragment
+
+    def attach(self, exec_node: ExecNode, ctx: RoutingContext) -> None:
+        """
+        Serve cached subtrees of the execution tree and drop their endpoints
+        from the context. Cacheable subtrees that missed are stored after
+        they rendered.
+        """
+        generation = RouteRegistry.generation()
+        if generation != self._generation:
+            self._fragments.clear()
+            self._generation = generation
+
+        self._attach(exec_node, ctx)
+
+    def _attach(self, exec_node: ExecNode, ctx: RoutingContext) -> None:
+        route = RouteRegistry.get_node(exec_node.node_id)
+        config = route.fragment_cache if route else None
+
+        if config is not None and not exec_node.is_lacy:
+            key = self.create_key(exec_node, config, ctx)
+            fragment = self.get(key)
+            if fragment is not None:
+                exec_node.fragment = fragment
+                for node in exec_node.walk():
+                    _ = ctx.endpoints.pop(node.node_id, None)
+                return
+
+            exec_node.fragment_slot = FragmentSlot(self, key, config.ttl)
+
+        for slot in exec_node.slots.values():
+            self._attach(slot, ctx)
+        if isinstance(exec_node.child_node, ExecNode):
+            self._attach(exec_node.child_node, ctx)
+
+    @staticmethod
+    def create_key(exec_node: ExecNode, config: FragmentCacheConfig, ctx: RoutingContext) -> str:
+        """
+        Shape of the subtree (node ids and segment keys) and the values it
+        varies by. Values are taken from the variables of every node in the
+        subtree, path variables consumed below its root included.
+        """
+        nodes = list(exec_node.walk())
+        shape = [(node.node_id, node.segment, node.is_lacy) for node in nodes]
+        variables: dict[str, Any] = {}
+        for node in nodes:
+            variables.update(node.variables)
+
+        if config.vary_by is not None:
+            names = set(config.vary_by)
+        else:
+            names = {name for name in variables if name in ctx.path_vars}
+            for node in nodes:
+                route = RouteRegistry.get_node(node.node_id)
+                names.update(route.endpoint_inputs if route else ())
+
+        values = {name: variables.get(name) for name in sorted(names)}
+        return json.dumps([shape, values], default=str)
+
+    def info(self) -> FragmentCacheInfo:
+        return FragmentCacheInfo(self.hits, self.misses, self.maxsize, len(self._fragments))
+
+    def clear(self) -> None:
+        self._fragments.clear()
+        self.hits = 0
+        self.misses = 0
@@ -0,0 +1,88 @@
+from __future__ import annotations
+
+from typing import Any, TypedDict
+import hashlib
+import json
+import os
+
+from .routing import PageNode
+
+
+MANIFEST_VERSION = 1
+
+
+class ManifestEntry(TypedDict):
+    node_id: str
+    segment: str
+    directory: list[str]
+    parent_id: str | None
+    is_static: bool
+    default_child: str | None
+    endpoint_inputs: list[str] | None
+
+
+def pages_fingerprint(pages_dir: str) -> str:
+    """
+    Hash of the route files below the pages folder. Paths, sizes and
+    modification times are hashed, file contents are not read.
+    """
+    digest = hashlib.sha256(str(MANIFEST_VERSION).encode())
+
+    for current_dir, dir_names, file_names in os.walk(pages_dir):
+        dir_names[:] = sorted(name for name in dir_names if not name.startswith((".", "_")))
+        relative_dir = os.path.relpath(current_dir, pages_dir)
+
+        for file_name in sorted(file_names):
+            if not file_name.endswith(".py"):
+                continue
+            stat = os.stat(os.path.join(current_dir, file_name))
+            digest.update(
+                f"{relative_dir}/{file_name}:{stat.st_size}:{stat.st_mtime_ns}\n".encode()
+            )
+
+    return digest.hexdigest()
+
+
+def create_manifest_entry(node: PageNode, segment: str, directory: list[str]) -> ManifestEntry:
+    return ManifestEntry(
+        node_id=node.node_id,
+        segment=segment,
+        directory=directory,
+        parent_id=node.parent_id,
+        is_static=node.is_static,
+        default_child=node.default_child,
+        # Inputs of placeholder nodes are only known after import
+        endpoint_inputs=sorted(node.endpoint_inputs) if node.is_loaded else None,
+    )
+
+
+def read_manifest(path: str, fingerprint: str) -> list[ManifestEntry] | None:
+    """Entries in registration order, None if the manifest is missing or stale"""
+    try:
+        with open(path, encoding="utf-8") as file:
+            manifest: dict[str, Any] = json.load(file)
+    except (OSError, ValueError):
+        return None
+
+    if manifest.get("version") != MANIFEST_VERSION or manifest.get("fingerprint") != fingerprint:
+        return None
+
+    return manifest.get("nodes")
+
+
+def write_manifest(path: str, fingerprint: str, entries: list[ManifestEntry]) -> bool:
+    """Write the manifest atomically, read-only filesystems are skipped silently"""
+    manifest = {"version": MANIFEST_VERSION, "fingerprint": fingerprint, "nodes": entries}
+    temp_path = f"{path}.{os.getpid()}.tmp"
+
+    try:
+        directory = os.path.dirname(path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        with open(temp_path, "w", encoding="utf-8") as file:
+            json.dump(manifest, file)
+        os.replace(temp_path, path)
+    except OSError:
+        return False
+
+    return True
@@ -0,0 +1,208 @@
+from __future__ import annotations
+
+from collections.abc import Iterable, Sequence
+from typing import TYPE_CHECKING
+
+from ..types import PathVariables
+from ..utils.constants import REST_TOKEN
+
+if TYPE_CHECKING:
+    from .routing import RouteNode
+
+
+REST_VARIABLE = "rest"
+
+
+def _variable_name(segment: str) -> str:
+    name = segment[1:-1]
+    if name in {REST_TOKEN, REST_TOKEN.replace("_", "-")}:
+        return REST_VARIABLE
+    return name.replace("-", "_")
+
+
+def _is_template(segment: str) -> bool:
+    return segment.startswith("[") and segment.endswith("]")
+
+
+class _StaticTrieNode:
+    __slots__ = ("literals", "variable", "route", "rest_route")
+
+    def __init__(self) -> None:
+        self.literals: dict[str, _StaticTrieNode] = {}
+        self.variable: _StaticTrieNode | None = None
+        self.route: tuple[RouteNode, tuple[str, ...]] | None = None
+        self.rest_route: tuple[RouteNode, tuple[str, ...]] | None = None
+
+
+class StaticRouteMatcher:
+    """
+    Segment trie over the static routes of the registry.
+
+    Literal segments take precedence over path templates and path templates
+    over catch-all segments, so ``/users/settings`` wins over ``/users/[id]``.
+    Resolution cost depends on the number of URL segments, not on the number
+    of registered static routes.
+    """
+
+    __slots__ = ("_root",)
+
+    def __init__(self, nodes: Iterable[RouteNode] = ()) -> None:
+        self._root = _StaticTrieNode()
+        for node in nodes:
+            self.add(node)
+
+    def add(self, node: RouteNode) -> None:
+        current = self._root
+        names = list[str]()
+        segments = [seg for seg in node.path.strip("/").split("/") if seg]
+
+        for index, segment in enumerate(segments):
+            if not _is_template(segment):
+                current = current.literals.setdefault(segment, _StaticTrieNode())
+                continue
+
+            name = _variable_name(segment)
+            names.append(name)
+
+            if name == REST_VARIABLE:
+                if index != len(segments) - 1:
+                    raise ValueError(
+                        f"Catch-all segment of static route {node.path} must be the last segment"
+                    )
+                if current.rest_route is not None:
+                    raise KeyError(f"{node.path} conflicts with {current.rest_route[0].path}")
+                current.rest_route = (node, tuple(names))
+                return
+
+            if current.variable is None:
+                current.variable = _StaticTrieNode()
+            current = current.variable
+
+        if current.route is not None:
+            raise KeyError(f"{node.path} conflicts with {current.route[0].path}")
+        current.route = (node, tuple(names))
+
+    def match(self, pathname: str) -> tuple[RouteNode | None, PathVariables]:
+        """Resolve a pathname to its static node and the captured path variables."""
+        segments = [seg for seg in pathname.strip("/").split("/") if seg]
+        values = list[str | list[str]]()
+        route = self._match(self._root, segments, 0, values)
+
+        if route is None:
+            return None, {}
+
+        node, names = route
+        return node, dict(zip(names, values))
+
+    def _match(
+        self,
+        trie_node: _StaticTrieNode,
+        segments: list[str],
+        index: int,
+        values: list[str | list[str]],
+    ) -> tuple[RouteNode, tuple[str, ...]] | None:
+        if index == len(segments):
+            if trie_node.route is not None:
+                return trie_node.route
+            if trie_node.rest_route is not None:
+                values.append([])
+                return trie_node.rest_route
+            return None
+
+        segment = segments[index]
+
+        if literal := trie_node.literals.get(segment):
+            if route := self._match(literal, segments, index + 1, values):
+                return route
+
+        if trie_node.variable is not None:
+            values.append(segment)
+            if route := self._match(trie_node.variable, segments, index + 1, values):
+                return route
+            values.pop()
+
+        if trie_node.rest_route is not None:
+            values.append(segments[index:])
+            return trie_node.rest_route
+
+        return None
+
+
+class _RouteTrieNode:
+    __slots__ = ("literals", "route", "path_template")
+
+    def __init__(self) -> None:
+        self.literals: dict[str, _RouteTrieNode] = {}
+        self.route: RouteNode | None = None
+        self.path_template: RouteNode | None = None
+
+
+class RouteTrie:
+    """
+    Segment trie over the dynamic routes below a node (or below the root).
+
+    Keys may span several URL segments, e.g. ``module/reports`` when empty
+    folders stay part of the URL. A path template is stored on the trie node
+    of its literal prefix and matches without consuming its own segment,
+    the value is consumed later when the template node itself is resolved.
+    """
+
+    __slots__ = ("_root",)
+
+    def __init__(self) -> None:
+        self._root = _RouteTrieNode()
+
+    def add(self, key: str, node: RouteNode) -> None:
+        current = self._root
+        for segment in key.strip("/").split("/"):
+            if _is_template(segment):
+                if current.path_template is not None:
+                    raise ValueError(f"{node.path} already has a path template!")
+                current.path_template = node
+                return
+            current = current.literals.setdefault(segment, _RouteTrieNode())
+
+        if current.route is not None:
+            raise KeyError(f"{node.path} conflicts with {current.route.path}")
+        current.route = node
+
+    def match(self, segments: Sequence[str], top: int | None = None) -> tuple[RouteNode | None, int]:
+        """
+        Descend the trie along a segment stack, the next segment is the item
+        below ``top`` (defaults to the end of the stack).
+
+        Returns the matched node and the number of segments its key consumed.
+        Explicit routes take precedence over path templates.
+        """
+        current = self._root
+        template: RouteNode | None = current.path_template
+        template_depth = 0
+        depth = 0
+        index = len(segments) if top is None else top
+
+        while index > 0:
+            index -= 1
+            next_node = current.literals.get(segments[index])
+            if next_node is None:
+                break
+
+            current = next_node
+            depth += 1
+            if current.route is not None:
+                return current.route, depth
+
+            if current.path_template is not None:
+                template = current.path_template
+                template_depth = depth
+
+        return template, template_depth
+
+    def literals(self) -> frozenset[str]:
+        """Literal segments of all keys, any other value can only match a path template"""
+        found = set[str]()
+        stack = [self._root]
+        while stack:
+            current = stack.pop()
+            found.update(current.literals)
+            stack.extend(current.literals.values())
+        return frozenset(found)
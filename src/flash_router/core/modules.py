@@ -0,0 +1,114 @@
+from __future__ import annotations
+
+from importlib.util import spec_from_file_location, module_from_spec
+from types import ModuleType
+from typing import Any
+import ast
+import os
+import sys
+import threading
+import time
+
+
+class RouteModuleCache:
+    """
+    Loads every route file once during tree construction. Config, layout
+    and endpoint lookups of the same file are answered from the cached module
+    and modules that are already registered in ``sys.modules`` for the same
+    file are reused instead of executed again.
+
+    Loads of different files are safe to run on a worker pool, the time spent
+    executing each file is recorded in ``import_times``.
+    """
+
+    __slots__ = ("_modules", "_lock", "import_times")
+
+    def __init__(self) -> None:
+        self._modules: dict[str, ModuleType] = {}
+        self._lock = threading.Lock()
+        self.import_times: dict[str, float] = {}
+
+    def load(self, module_name: str, file_path: str) -> ModuleType:
+        file_path = os.path.abspath(file_path)
+        if module := self._modules.get(file_path):
+            return module
+
+        module = self._registered_module(module_name, file_path)
+        if module is None:
+            spec = spec_from_file_location(module_name, file_path)
+            if spec is None or spec.loader is None:
+                raise ImportError(f"Cannot create spec for {file_path}")
+
+            module = module_from_spec(spec)
+            start = time.perf_counter()
+            spec.loader.exec_module(module)
+            self.import_times[file_path] = time.perf_counter() - start
+
+            with self._lock:
+                if module_name not in sys.modules:
+                    sys.modules[module_name] = module
+
+        with self._lock:
+            return self._modules.setdefault(file_path, module)
+
+    def slowest_imports(self, limit: int = 10) -> list[tuple[str, float]]:
+        """Files with the longest import time (seconds), slowest first"""
+        return sorted(self.import_times.items(), key=lambda item: item[1], reverse=True)[:limit]
+
+    def clear(self) -> None:
+        self._modules.clear()
+        self.import_times.clear()
+
+    def __len__(self) -> int:
+        return len(self._modules)
+
+    def __contains__(self, file_path: str) -> bool:
+        return os.path.abspath(file_path) in self._modules
+
+    @staticmethod
+    def _registered_module(module_name: str, file_path: str) -> ModuleType | None:
+        module = sys.modules.get(module_name)
+        module_file = getattr(module, "__file__", None)
+        if module_file and os.path.abspath(module_file) == file_path:
+            return module
+        return None
+
+
+STRUCTURAL_CONFIG_KEYS = ("is_static", "default_child")
+
+
+def read_static_config(file_path: str) -> dict[str, Any] | None:
+    """
+    Read the structural settings of a ``config = RouteConfig(...)`` assignment
+    without importing the route file. Returns None when they are computed at
+    import time and the file has to be imported to know them.
+    """
+    with open(file_path, encoding="utf-8") as file:
+        tree = ast.parse(file.read(), filename=file_path)
+
+    config: dict[str, Any] = {}
+    for statement in tree.body:
+        if isinstance(statement, ast.Assign):
+            targets = statement.targets
+        elif isinstance(statement, ast.AnnAssign):
+            targets = [statement.target]
+        else:
+            continue
+
+        if not any(isinstance(target, ast.Name) and target.id == "config" for target in targets):
+            continue
+
+        value = statement.value
+        if not isinstance(value, ast.Call) or any(arg.arg is None for arg in value.keywords):
+            return None
+
+        config = {}
+        for keyword in value.keywords:
+            if keyword.arg not in STRUCTURAL_CONFIG_KEYS:
+                continue
+            try:
+                config[keyword.arg] = ast.literal_eval(keyword.value)
+            except ValueError:
+                return None
+
+    return config
@@ -0,0 +1,191 @@
+from __future__ import annotations
+
+from collections import OrderedDict
+from dataclasses import dataclass
+from typing import NamedTuple
+
+from .execution import ExecNode
+from .routing import RouteNode, RouteRegistry, RoutingContext
+from ..types import Layout, ResolveType
+
+
+PlanKey = tuple[ResolveType, str, tuple[str | None, ...]]
+
+
+class PlanCacheInfo(NamedTuple):
+    hits: int
+    misses: int
+    maxsize: int
+    currsize: int
+
+
+@dataclass(frozen=True, slots=True, eq=False)
+class PlanStep:
+    """
+    Precomputed resolution of a single node. Only the path variable values,
+    and with them the segment keys of path templates, are bound per request.
+    """
+
+    node: RouteNode
+    layout: Layout
+    segment_key: str | None
+    is_lacy: bool
+    has_endpoint: bool
+    resolves_child: bool
+    consumed: int
+    child: "PlanStep | None"
+    slots: tuple[tuple[str, "PlanStep"], ...]
+
+    def bind(self, ctx: RoutingContext) -> ExecNode:
+        node = self.node
+        segment_key = self.segment_key
+
+        if node.is_path_template:
+            if segment_key is None:
+                segment_key = node.create_segment_key(ctx.peek_segment())
+            _ = ctx.consume_path_var(node)
+
+        exec_node = ExecNode(
+            segment=segment_key, # pyright: ignore[reportArgumentType]
+            node_id=node.node_id,
+            layout=self.layout,
+            parent_id=node.parent_id,
+            variables=ctx.variables,
+            loading=node.loading,
+            error=node.error,
+            is_lacy=self.is_lacy,
+        )
+
+        if self.is_lacy:
+            ctx.set_node_state(node, "done", segment_key) # pyright: ignore[reportArgumentType]
+            return exec_node
+
+        if self.has_endpoint:
+            ctx.add_endpoint(node)
+
+        if self.resolves_child:
+            ctx.drop_segments(self.consumed)
+            exec_node.child_node = self.child.bind(ctx) if self.child else None
+
+        if self.slots:
+            slot_exec_nodes: dict[str, ExecNode] = {}
+            for slot_name, slot_step in self.slots:
+                ctx.set_node_state(slot_step.node, "done", slot_step.segment_key) # pyright: ignore[reportArgumentType]
+                slot_exec_nodes[slot_name] = slot_step.bind(ctx)
+            exec_node.slots = slot_exec_nodes
+
+        ctx.set_node_state(node, "done", segment_key) # pyright: ignore[reportArgumentType]
+        return exec_node
+
+
+def compile_plan(node: RouteNode, segments: list[str], resolve_type: ResolveType) -> PlanStep:
+    """
+    Walk the route below ``node`` without touching the segment stack and
+    compile the steps of its execution tree.
+    """
+    plan, _ = _compile_step(node, segments, len(segments), resolve_type)
+    return plan
+
+
+def _compile_step(
+    node: RouteNode, segments: list[str], top: int, resolve_type: ResolveType
+) -> tuple[PlanStep, int]:
+    """
+    Compile a node and its subtree against the segment stack below ``top``.
+    Children are resolved before slots, like in PlanStep.bind, so slots
+    match their own children against the segments left by the child chain.
+    Returns the step and the top of the remaining stack.
+    """
+    RouteRegistry.ensure_loaded(node)
+    has_value = True
+    if node.is_path_template:
+        has_value = top > 0 and bool(segments[top - 1])
+        top = 0 if node.is_rest else max(top - 1, 0)
+
+    is_lacy = node.loading is not None and resolve_type != "lacy" and has_value
+    layout = node.layout
+    if node.is_path_template and not has_value and node.default_layout is not None:
+        layout = node.default_layout
+
+    resolves_child = not is_lacy and bool(node.child_nodes or node.path_template)
+    child: PlanStep | None = None
+    consumed = 0
+    if resolves_child:
+        child_node, consumed = node.match_child(segments, top)
+        consumed = consumed if child_node else 1
+        top = max(top - consumed, 0)
+        if child_node is not None:
+            child, top = _compile_step(child_node, segments, top, resolve_type)
+
+    slots = list[tuple[str, PlanStep]]()
+    if not is_lacy:
+        for slot_name, slot_node in node.slots.items():
+            slot_step, top = _compile_step(slot_node, segments, top, resolve_type)
+            slots.append((slot_name, slot_step))
+
+    step = PlanStep(
+        node=node,
+        layout=layout,
+        segment_key=None if node.is_path_template and has_value else node.default_segment_key,
+        is_lacy=is_lacy,
+        has_endpoint=node.endpoint is not None and has_value,
+        resolves_child=resolves_child,
+        consumed=consumed,
+        child=child,
+        slots=tuple(slots),
+    )
+    return step, top
+
+
+class ResolutionPlanCache:
+    """
+    Bounded LRU of resolution plans keyed by the start node and the segment
+    stack, so a hit skips the route walk. Route keys are matched by literal
+    segments only, values that are no literal of any route key are masked
+    and URLs that only differ in path variable values share a plan. Plans
+    are built after the active root node is known, so the client loading
+    state is already reflected in the start node of the key.
+    """
+
+    def __init__(self, maxsize: int = 256) -> None:
+        self.maxsize = maxsize
+        self.hits = 0
+        self.misses = 0
+        self._plans: OrderedDict[PlanKey, PlanStep] = OrderedDict()
+        self._generation = RouteRegistry.generation()
+
+    def get_plan(self, node: RouteNode, ctx: RoutingContext) -> PlanStep:
+        generation = RouteRegistry.generation()
+        if generation != self._generation:
+            self._plans.clear()
+            self._generation = generation
+
+        literals = RouteRegistry.route_literals()
+        key: PlanKey = (
+            ctx.resolve_type,
+            node.node_id,
+            # Empty segments stay, a path template without value resolves differently
+            tuple(segment if not segment or segment in literals else None for segment in ctx.segments),
+        )
+
+        if plan := self._plans.get(key):
+            self.hits += 1
+            self._plans.move_to_end(key)
+            return plan
+
+        self.misses += 1
+        plan = compile_plan(node, ctx.segments, ctx.resolve_type)
+        if self.maxsize > 0:
+            self._plans[key] = plan
+            if len(self._plans) > self.maxsize:
+                _ = self._plans.popitem(last=False)
+
+        return plan
+
+    def info(self) -> PlanCacheInfo:
+        return PlanCacheInfo(self.hits, self.misses, self.maxsize, len(self._plans))
+
+    def clear(self) -> None:
+        self._plans.clear()
+        self.hits = 0
+        self.misses = 0
@@ -1,4 +1,4 @@
-from collections.abc import Callable
+from collections.abc import Callable, Collection
 from typing import get_type_hints, get_origin
 from pydantic import BaseModel
 import inspect
@@ -30,8 +30,8 @@ def should_skip(obj):
     return classify_type(obj) not in ("builtin", "typing", "pydantic")
 
 
-def extract_function_inputs(func: Layout | Endpoint | None):
-    """Recursively extracts function & class inputs"""
+def extract_function_inputs(func: Layout | Endpoint | None, exclude: Collection[str] = ()):
+    """Recursively extracts function & class inputs, parameters in ``exclude`` are skipped"""
     valid_classes = ("builtin", "typing", "pydantic")
     inputs = list[str]()
     types = dict[str, type]()
@@ -40,6 +40,9 @@ def extract_function_inputs(func: Layout | Endpoint | None):
         return inputs, types
 
     for param_name, param_type in get_type_hints(func).items():
+        if param_name in exclude:
+            continue
+
         type_class = classify_type(param_type)
 
         if type_class not in valid_classes:
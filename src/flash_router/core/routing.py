@@ -1,14 +1,44 @@
 # from flash_router.core.context import RoutingContext
-from ..utils.helper_functions import _parse_path_variables
+from .matching import RouteTrie, StaticRouteMatcher
+from .deadlines import call_with_deadline
 from ..utils.constants import DEFAULT_LAYOUT_TOKEN, REST_TOKEN
-from ..types import QueryParams, PathVariables, ResolveType, StateType, Endpoint, Layout, ErrorLayout, EndpointResults
+from ..utils.serialization import dumps
+from ..types import QueryParams, PathVariables, ResolveType, StateType, Endpoint, ExecutionMode, Layout, ErrorLayout, EndpointResult, EndpointResults
 
 from pydantic import BaseModel, ConfigDict, Field
+from collections.abc import Awaitable, Callable, Iterable, Mapping
+from dataclasses import dataclass, field
+from types import MappingProxyType
 from typing import Any, ClassVar
 from functools import partial
+import threading
 import asyncio
 
 
+class FragmentCacheConfig(BaseModel):
+    """
+    Cache the rendered subtree of a route as serialized JSON. Entries are keyed
+    by the shape of the subtree and the path variables and declared inputs of
+    its nodes, ``vary_by`` replaces these inputs with an explicit list.
+    """
+
+    ttl: float | None = None
+    vary_by: list[str] | None = None
+
+
+class EndpointCacheConfig(BaseModel):
+    """
+    Cache the result of the route endpoint for ``ttl`` seconds, keyed by the
+    values of the endpoint inputs. Expired results are still served for up
+    to ``stale_while_revalidate`` seconds while one refresh runs in the
+    background.
+    """
+
+    ttl: float
+    stale_while_revalidate: float = 0
+    vary_by_session: bool = False
+
+
 class RouteConfig(BaseModel):
     model_config = ConfigDict(arbitrary_types_allowed=True, populate_by_name=True)
 
@@ -24,6 +54,15 @@ class RouteConfig(BaseModel):
     default_layout: Layout | None = Field(default=None, alias="default")
     loading: Layout | None = None
     error: ErrorLayout | None = None
+    fragment_cache: FragmentCacheConfig | None = None
+    endpoint_cache: EndpointCacheConfig | None = None
+    # Seconds until the endpoint result is replaced with a TimeoutError
+    endpoint_timeout: float | None = None
+    # Endpoint keyword -> ancestor route (folder path) whose endpoint result it receives
+    endpoint_depends: dict[str, str] | None = None
+    # How synchronous layouts and endpoints run, None follows the router default.
+    # "process" renders the page layout in a process pool with picklable arguments
+    execution: ExecutionMode | None = None
 
 
 class RouterResponse(BaseModel):
@@ -33,6 +72,13 @@ class RouterResponse(BaseModel):
     mimetype: str = "application/json"
     multi: bool = False
 
+    def to_json(self, typed_array_threshold: int | None = None) -> bytes:
+        """Serialize the response and the component trees it holds in a single pass"""
+        return dumps(
+            {"response": self.response, "mimetype": self.mimetype, "multi": self.multi},
+            typed_array_threshold=typed_array_threshold,
+        )
+
 
 class PageNode(BaseModel):
     model_config = ConfigDict(arbitrary_types_allowed=True, populate_by_name=True)
@@ -54,6 +100,12 @@ class PageNode(BaseModel):
     error: ErrorLayout | None = None
     endpoint: Endpoint | None = None
     endpoint_inputs: set[str] = Field(default_factory=set)
+    fragment_cache: FragmentCacheConfig | None = None
+    endpoint_cache: EndpointCacheConfig | None = None
+    endpoint_timeout: float | None = None
+    endpoint_depends: dict[str, str] = Field(default_factory=dict)
+    # Placeholder nodes of lazy routers are loaded on first resolution
+    is_loaded: bool = True
 
     @property
     def is_slot(self):
@@ -101,7 +153,83 @@ class PageNode(BaseModel):
         path_template_key = path_key + filled_template
         return path_template_key
 
-    def get_child_node(self, segment: str | None) -> "PageNode | None":
+
+@dataclass(frozen=True, slots=True, eq=False)
+class RouteNode:
+    """
+    Immutable route node compiled from a registered PageNode.
+    Flags, segment and segment keys are computed once and parent, child
+    and slot relations are direct references instead of node id lookups.
+    """
+
+    node_id: str
+    segment_value: str
+    segment: str
+    module: str
+    path: str
+    layout: Layout
+    default_layout: Layout | None
+    loading: Layout | None
+    error: ErrorLayout | None
+    endpoint: Endpoint | None
+    endpoint_inputs: frozenset[str]
+    parent_id: str | None
+    default_child: str | None
+    is_slot: bool
+    is_path_template: bool
+    is_rest: bool
+    is_static: bool
+    is_root: bool
+    default_segment_key: str
+    is_loaded: bool
+    fragment_cache: FragmentCacheConfig | None
+    endpoint_cache: EndpointCacheConfig | None
+    endpoint_timeout: float | None
+    endpoint_depends: Mapping[str, str]
+    parent: "RouteNode | None" = field(default=None, repr=False)
+    child_nodes: Mapping[str, "RouteNode"] = field(default_factory=dict, repr=False)
+    slots: Mapping[str, "RouteNode"] = field(default_factory=dict, repr=False)
+    path_template: "RouteNode | None" = field(default=None, repr=False)
+    default_child_node: "RouteNode | None" = field(default=None, repr=False)
+    child_routes: RouteTrie | None = field(default=None, repr=False)
+
+    @classmethod
+    def from_page_node(cls, node: PageNode) -> "RouteNode":
+        is_path_template = node.is_path_template
+        return cls(
+            node_id=node.node_id,
+            segment_value=node.segment_value,
+            segment=node.segment,
+            module=node.module,
+            path=node.path,
+            layout=node.layout,
+            default_layout=node.default_layout,
+            loading=node.loading,
+            error=node.error,
+            endpoint=node.endpoint,
+            endpoint_inputs=frozenset(node.endpoint_inputs),
+            parent_id=node.parent_id,
+            default_child=node.default_child,
+            is_slot=node.is_slot,
+            is_path_template=is_path_template,
+            is_rest=is_path_template and node.segment == REST_TOKEN,
+            is_static=node.is_static,
+            is_root=bool(node.is_root),
+            default_segment_key=node.create_segment_key(None),
+            is_loaded=node.is_loaded,
+            fragment_cache=node.fragment_cache,
+            endpoint_cache=node.endpoint_cache,
+            endpoint_timeout=node.endpoint_timeout,
+            endpoint_depends=MappingProxyType(dict(node.endpoint_depends)),
+        )
+
+    def create_segment_key(self, var: str | None):
+        if not self.is_path_template or not var:
+            return self.default_segment_key
+
+        return f"{self.segment_value}[{var}]"
+
+    def get_child_node(self, segment: str | None) -> "RouteNode | None":
         """
         Resolve child node with the following priority:
         1. Default child (when no segment provided)
@@ -110,21 +238,59 @@ class PageNode(BaseModel):
 
         This ensures /users/settings takes precedence over /users/[id]
         """
+        child_node, _ = self.match_child([segment] if segment else [])
+        return child_node
 
-        if not segment and self.default_child:
-            default_node_id = self.child_nodes.get(self.default_child)
-            return RouteRegistry.get_node(default_node_id)
+    def match_child(
+        self, segments: list[str], top: int | None = None
+    ) -> tuple["RouteNode | None", int]:
+        """
+        Resolve the child node for a segment stack (last item is the next segment).
+        Returns the child and the number of segments consumed by its route key.
+        """
+        if top is None:
+            top = len(segments)
 
-        if child_id := self.child_nodes.get(segment):
-            return RouteRegistry.get_node(child_id)
+        if not top and self.default_child_node:
+            return self.default_child_node, 0
 
-        if self.path_template:
-            return RouteRegistry.get_node(self.path_template)
+        if self.child_routes is None:
+            return None, 0
 
-        return None
+        return self.child_routes.match(segments, top)
 
     def get_slots(self):
-        return {key: RouteRegistry.get_node(val) for key, val in self.slots.items()}
+        return dict(self.slots)
+
+
+class EndpointDependencyError(Exception):
+    pass
+
+
+async def _settle(awaitable: Awaitable[EndpointResult]) -> EndpointResult:
+    try:
+        return await awaitable
+    except Exception as e:
+        return e
+
+
+_LOADED_FIELDS = (
+    "layout",
+    "default_layout",
+    "loading",
+    "error",
+    "endpoint",
+    "fragment_cache",
+    "endpoint_cache",
+    "endpoint_timeout",
+    "endpoint_depends",
+)
+
+
+def _bind(node: RouteNode, **relations: Any) -> None:
+    """Link compiled nodes, only used while the registry is compiled or a lazy node is loaded"""
+    for name, value in relations.items():
+        object.__setattr__(node, name, value)
 
 
 class DynamicRootRegistry(BaseModel):
@@ -140,6 +306,16 @@ class RouteRegistry:
     _nodes: ClassVar[dict[str, PageNode]] = {}
     _static_root: ClassVar[dict[str, PageNode]] = {}
     _dynamic_root: ClassVar[DynamicRootRegistry] = DynamicRootRegistry()
+    _static_matcher: ClassVar[StaticRouteMatcher | None] = None
+    _root_routes: ClassVar[RouteTrie | None] = None
+    _routes: ClassVar[dict[str, RouteNode]] = {}
+    _input_index: ClassVar[dict[str, tuple[RouteNode, ...]]] = {}
+    _route_literals: ClassVar[frozenset[str]] = frozenset()
+    _ignore_empty_folders: ClassVar[bool] = False
+    _generation: ClassVar[int] = 0
+    _node_loader: ClassVar[Callable[[str], PageNode] | None] = None
+    _load_lock: ClassVar[threading.Lock] = threading.Lock()
+    _frozen: ClassVar[bool] = False
 
     def __new__(cls):
         raise TypeError("RouteRegistry is a static class and should not be instantiated")
@@ -148,15 +324,22 @@ class RouteRegistry:
 
     @classmethod
     def add_node(cls, node: PageNode) -> None:
+        if cls._frozen:
+            raise RuntimeError(f"RouteRegistry is frozen, cannot register {node.node_id}")
         if node.node_id in cls._nodes:
             raise KeyError(f"{node.segment} is already registered!")
         cls._nodes[node.node_id] = node
+        # Lookup structures are rebuilt on the next compile
+        cls._static_matcher = None
+        cls._root_routes = None
 
     @classmethod
-    def get_node(cls, node_id: str | None) -> PageNode | None:
+    def get_node(cls, node_id: str | None) -> RouteNode | None:
         if node_id is None:
             return None
-        return cls._nodes.get(node_id)
+        if cls._root_routes is None:
+            cls.compile(cls._ignore_empty_folders)
+        return cls._routes.get(node_id)
 
     @classmethod
     def register_node(cls, new_node: PageNode, parent_node: PageNode | None) -> None:
@@ -204,55 +387,198 @@ class RouteRegistry:
             )
         cls._dynamic_root.routes[node.segment] = node.node_id
 
-    # --- Route Resolution ---
+    # --- Compilation ---
 
     @classmethod
-    def get_static_route(cls, ctx: "RoutingContext") -> tuple[PageNode | None, PathVariables]:
-        path_variables: PathVariables = {}
+    def compile(cls, ignore_empty_folders: bool = False) -> None:
+        """
+        Compile the registered page nodes into linked RouteNodes and
+        build the lookup structures used during route resolution.
+        """
+        if cls._frozen:
+            raise RuntimeError("RouteRegistry is frozen and cannot be recompiled")
 
-        if not ctx.pathname:
-            index_node = cls._static_root.get("/")
-            return index_node, path_variables
+        routes = {
+            node_id: RouteNode.from_page_node(node)
+            for node_id, node in cls._nodes.items()
+        }
+        root_routes = RouteTrie()
+        child_routes = dict[str, RouteTrie]()
+        input_index = dict[str, list[RouteNode]]()
+
+        for node_id, node in cls._nodes.items():
+            route = routes[node_id]
+            for node_input in route.endpoint_inputs:
+                input_index.setdefault(node_input, []).append(route)
+
+            parent_route = routes.get(node.parent_id) if node.parent_id else None
+            _bind(
+                route,
+                parent=parent_route,
+                child_nodes=MappingProxyType(
+                    {key: routes[child_id] for key, child_id in node.child_nodes.items()}
+                ),
+                slots=MappingProxyType(
+                    {key: routes[slot_id] for key, slot_id in node.slots.items()}
+                ),
+                path_template=routes.get(node.path_template) if node.path_template else None,
+                default_child_node=(
+                    routes.get(node.child_nodes.get(node.default_child, ""))
+                    if node.default_child
+                    else None
+                ),
+            )
+
+            if route.is_static or route.is_slot:
+                continue
 
-        for page_path, page_node in cls._static_root.items():
-            if "[" in page_path and "]" in page_path:
-                path_variables = _parse_path_variables(ctx.pathname, page_path)
-                if path_variables:
-                    return page_node, path_variables
+            route_key = cls._create_route_key(route, parent_route, ignore_empty_folders)
+            if route.is_root or parent_route is None:
+                root_routes.add(route_key, route)
+            else:
+                child_routes.setdefault(parent_route.node_id, RouteTrie()).add(route_key, route)
+
+        route_literals = set(root_routes.literals())
+        for node_id, trie in child_routes.items():
+            _bind(routes[node_id], child_routes=trie)
+            route_literals.update(trie.literals())
+
+        cls._routes = routes
+        cls._root_routes = root_routes
+        cls._input_index = {key: tuple(nodes) for key, nodes in input_index.items()}
+        cls._route_literals = frozenset(route_literals)
+        cls._static_matcher = StaticRouteMatcher(
+            routes[node.node_id] for path, node in cls._static_root.items() if path != "/"
+        )
+        cls._ignore_empty_folders = ignore_empty_folders
+        cls._generation += 1
 
-            if ctx.pathname == page_path:
-                return page_node, path_variables
+    @classmethod
+    def freeze(cls) -> None:
+        """
+        Mark the compiled registry as final. Forked workers share it with the
+        master process, so any later registration or recompile is an error.
+        """
+        if cls._root_routes is None:
+            cls.compile(cls._ignore_empty_folders)
+        cls._frozen = True
 
-        return None, path_variables
+    @classmethod
+    def route_literals(cls) -> frozenset[str]:
+        """Literal segments of all dynamic route keys"""
+        if cls._root_routes is None:
+            cls.compile(cls._ignore_empty_folders)
+        return cls._route_literals
 
     @classmethod
-    def get_root_node(cls, ctx: "RoutingContext") -> PageNode | None:
-        missed_segments: str | None = None
-        node: PageNode | None = None
+    def generation(cls) -> int:
+        """Counter bumped on every compile, compiled nodes of older generations are stale"""
+        return cls._generation
+
+    @staticmethod
+    def _create_route_key(
+        node: RouteNode, parent_node: RouteNode | None, ignore_empty_folders: bool
+    ) -> str:
+        """URL segments leading from the parent node to the node"""
+        if ignore_empty_folders:
+            return node.path.rsplit("/", 1)[-1]
 
-        for segment in ctx.segments:
-            if missed_segments:
-                segment = missed_segments + "/" + segment
+        if parent_node is None or parent_node.path == "/":
+            return node.path
+
+        return node.path.removeprefix(parent_node.path + "/")
+
+    @classmethod
+    def get_input_consumers(cls, inputs: Iterable[str]) -> list[RouteNode]:
+        """Nodes whose layout or endpoint declares one of the inputs"""
+        if cls._root_routes is None:
+            cls.compile(cls._ignore_empty_folders)
 
-            if node_id := cls._dynamic_root.routes.get(segment):
-                node = cls.get_node(node_id)
-                ctx.segments.pop(0) if ctx.segments else None
-                return node
+        consumers = dict[str, RouteNode]()
+        for node_input in inputs:
+            for node in cls._input_index.get(node_input, ()):
+                consumers[node.node_id] = node
 
-            if node_id := cls._dynamic_root.path_template:
-                node = cls.get_node(node_id)
-                ctx.path_vars[node.segment] = segment # pyright: ignore[reportOptionalMemberAccess]
-                return node
+        return list(consumers.values())
 
-            missed_segments = segment
-            ctx.segments.pop(0) if ctx.segments else None
+    # --- Lazy Loading ---
+
+    @classmethod
+    def set_node_loader(cls, loader: Callable[[str], PageNode] | None) -> None:
+        """Loader that imports the route modules of a placeholder node by node id"""
+        cls._node_loader = loader
+
+    @classmethod
+    def ensure_loaded(cls, node: RouteNode) -> None:
+        """
+        Import the route modules of a placeholder node and bind its layouts
+        and endpoint. Structure and relations of the node stay untouched.
+        """
+        if node.is_loaded:
+            return
+
+        with cls._load_lock:
+            if node.is_loaded:
+                return
+
+            if cls._node_loader is None:
+                raise RuntimeError(f"No loader registered for lazy route node {node.node_id}")
+
+            loaded = cls._node_loader(node.node_id)
+            page_node = cls._nodes[node.node_id]
+            for name in _LOADED_FIELDS:
+                setattr(page_node, name, getattr(loaded, name))
+            page_node.endpoint_inputs = loaded.endpoint_inputs
+            page_node.is_loaded = True
+
+            # Inputs restored from a manifest are already indexed
+            for node_input in loaded.endpoint_inputs - node.endpoint_inputs:
+                cls._input_index[node_input] = (*cls._input_index.get(node_input, ()), node)
+
+            # is_loaded is bound last, readers skip the lock once it is set
+            _bind(
+                node,
+                **{name: getattr(loaded, name) for name in _LOADED_FIELDS},
+                endpoint_inputs=frozenset(loaded.endpoint_inputs),
+                is_loaded=True,
+            )
+
+    @classmethod
+    def unloaded_nodes(cls) -> list[RouteNode]:
+        if cls._root_routes is None:
+            cls.compile(cls._ignore_empty_folders)
+        return [node for node in cls._routes.values() if not node.is_loaded]
+
+    # --- Route Resolution ---
+
+    @classmethod
+    def get_static_route(cls, ctx: "RoutingContext") -> tuple[RouteNode | None, PathVariables]:
+        if cls._static_matcher is None:
+            cls.compile(cls._ignore_empty_folders)
+
+        if not ctx.pathname.strip("/"):
+            return cls._routes.get("/"), {}
+
+        return cls._static_matcher.match(ctx.pathname) # pyright: ignore[reportOptionalMemberAccess]
+
+    @classmethod
+    def get_root_node(cls, ctx: "RoutingContext") -> RouteNode | None:
+        """Match the root node against the segment stack of the context"""
+        node, consumed = cls._root_routes.match(ctx.segments) # pyright: ignore[reportOptionalMemberAccess]
+        ctx.drop_segments(consumed)
+
+        if node and node.is_path_template and ctx.segments:
+            ctx.set_path_var(node.segment, ctx.peek_segment())
 
         return node
 
     @classmethod
-    def get_active_root_node(cls, ctx: "RoutingContext", ignore_empty_folders: bool) -> PageNode | None:
+    def get_active_root_node(cls, ctx: "RoutingContext", ignore_empty_folders: bool) -> RouteNode | None:
+        if cls._root_routes is None or cls._ignore_empty_folders != ignore_empty_folders:
+            cls.compile(ignore_empty_folders)
+
+        ctx.segments.reverse()
         active_node = cls.get_root_node(ctx)
-        ctx.segments = list(reversed(ctx.segments))
 
         while ctx.segments:
             if active_node is None:
@@ -269,22 +595,21 @@ class RouteRegistry:
                 if len(ctx.segments) <= 1:
                     return active_node
                 _ = ctx.consume_path_var(active_node)
-                next_segment = ctx.peek_segment()
 
             ctx.set_node_state(active_node, "done", segment_key)
             ctx.set_silent_loading_states(active_node, "done")
 
-            if child_node := active_node.get_child_node(next_segment):
-                if child_node.is_path_template and child_node.segment == REST_TOKEN:
-                    return child_node
+            child_node, consumed = active_node.match_child(ctx.segments)
+            if child_node:
+                ctx.drop_segments(consumed)
 
-                if not child_node.is_path_template:
-                    _ = ctx.pop_segment()
+                if child_node.is_rest:
+                    return child_node
 
                 active_node = child_node
                 continue
 
-            ctx.merge_segments(ignore_empty_folders)
+            _ = ctx.pop_segment()
 
         return active_node
 
@@ -296,9 +621,17 @@ class RouteRegistry:
         cls._nodes.clear()
         cls._static_root.clear()
         cls._dynamic_root = DynamicRootRegistry()
+        cls._static_matcher = None
+        cls._routes = {}
+        cls._input_index = {}
+        cls._route_literals = frozenset()
+        cls._root_routes = None
+        cls._node_loader = None
+        cls._frozen = False
 
 
-class LoadingState(BaseModel):
+@dataclass(slots=True)
+class LoadingState:
     state: StateType
     node_id: str
     updated: bool = False
@@ -308,19 +641,42 @@ class LoadingState(BaseModel):
         self.updated = True
 
 
-class RoutingContext(BaseModel):
+class LoadingStateModel(BaseModel):
+    """Strict schema of a client loading state entry, used in validation mode"""
+    model_config = ConfigDict(extra="forbid")
+
+    state: StateType
+    node_id: str
+    updated: bool = False
+
+
+@dataclass(slots=True)
+class RoutingContext:
     """Encapsulates all routing state for a single request"""
     pathname: str
     query_params: QueryParams
     resolve_type: ResolveType
-    path_vars: PathVariables = Field(default_factory=dict)
-    endpoints: dict[str, Endpoint] = Field(default_factory=dict)
-    segments: list[str] = Field(default_factory=list)
-    loading_states: dict[str, LoadingState] = Field(default_factory=dict, repr=False)
+    path_vars: PathVariables = field(default_factory=dict)
+    endpoints: dict[str, Endpoint] = field(default_factory=dict)
+    segments: list[str] = field(default_factory=list)
+    loading_states: dict[str, LoadingState] = field(default_factory=dict, repr=False)
+    # Monotonic time all endpoints of the request have to finish by
+    deadline: float | None = None
+    endpoint_timeouts: dict[str, float] = field(default_factory=dict, repr=False)
+    # Endpoint keyword -> node id of the ancestor endpoint it waits for, per node id
+    endpoint_dependencies: dict[str, dict[str, str]] = field(default_factory=dict, repr=False)
+    _variables: QueryParams | PathVariables = field(init=False, repr=False)
+
+    def __post_init__(self) -> None:
+        self._variables = {**self.query_params, **self.path_vars}
 
     @property
     def variables(self):
-        return {**self.query_params, **self.path_vars}
+        """
+        Merged query parameters and path variables. The mapping is replaced,
+        never mutated, when a path variable is set, so it can be shared.
+        """
+        return self._variables
 
     @classmethod
     def from_request(
@@ -329,14 +685,26 @@ class RoutingContext(BaseModel):
         query_params: QueryParams,
         loading_state_dict: dict[str, PathVariables],
         resolve_type: ResolveType,
+        strict: bool = False,
     ):
-        """Create context from request data"""
+        """
+        Create context from request data. With ``strict`` every loading state
+        entry of the client store is validated against LoadingStateModel.
+        """
         path = pathname.strip("/")
         segments = [seg for seg in path.split("/") if seg] if path else []
-        loading_states = {
-            segment_key: LoadingState.model_validate(ils)
-            for segment_key, ils in loading_state_dict.items()
-        }
+
+        if strict:
+            loading_states = {
+                segment_key: LoadingState(**LoadingStateModel.model_validate(ils).model_dump())
+                for segment_key, ils in loading_state_dict.items()
+            }
+        else:
+            loading_states = {
+                segment_key: LoadingState(ils["state"], ils["node_id"]) # pyright: ignore[reportArgumentType]
+                for segment_key, ils in loading_state_dict.items()
+            }
+
         return cls(
             pathname=pathname,
             query_params=query_params,
@@ -345,6 +713,10 @@ class RoutingContext(BaseModel):
             loading_states=loading_states,
         )
 
+    def set_path_var(self, name: str, value: Any) -> None:
+        self.path_vars[name] = value
+        self._variables = {**self._variables, name: value}
+
     def get_node_state(self, segment_key: str):
         """Get loading state for a node"""
         ls = self.loading_states.get(segment_key)
@@ -352,7 +724,7 @@ class RoutingContext(BaseModel):
             return ls.state
         return None
 
-    def set_node_state(self, node: PageNode, state: StateType, segment_key: str):
+    def set_node_state(self, node: RouteNode, state: StateType, segment_key: str):
         """Set loading state for a node"""
         if segment_key not in self.loading_states:
             self.loading_states[segment_key] = LoadingState(
@@ -361,14 +733,42 @@ class RoutingContext(BaseModel):
         else:
             self.loading_states[segment_key].update_state(state)
 
-    def add_endpoint(self, node: PageNode):
+    def add_endpoint(self, node: RouteNode):
         endpoint = node.endpoint
         if endpoint is None:
             raise ValueError(f"Can not add none present endpoint for Node: {node.node_id}")
         partial_endpoint = partial(endpoint, **self.variables)
         self.endpoints[node.node_id] = partial_endpoint
+        if node.endpoint_timeout is not None:
+            self.endpoint_timeouts[node.node_id] = node.endpoint_timeout
+        if node.endpoint_depends:
+            self.endpoint_dependencies[node.node_id] = {
+                name: self._add_dependency(node, dependency_id)
+                for name, dependency_id in node.endpoint_depends.items()
+            }
+
+    def _add_dependency(self, node: RouteNode, dependency_id: str) -> str:
+        """
+        Schedule the endpoint of an ancestor a node depends on. Ancestors
+        that are not rendered in this request (e.g. on lacy loads) are
+        called for their result only.
+        """
+        ancestor = node.parent
+        while ancestor is not None and ancestor.node_id != dependency_id:
+            ancestor = ancestor.parent
+
+        if ancestor is None:
+            raise ValueError(f"Endpoint of {node.node_id} depends on {dependency_id}, which is no ancestor")
+
+        RouteRegistry.ensure_loaded(ancestor)
+        if ancestor.endpoint is None:
+            raise ValueError(f"Endpoint of {node.node_id} depends on {dependency_id}, which has no endpoint")
+
+        if dependency_id not in self.endpoints:
+            self.add_endpoint(ancestor)
+        return dependency_id
 
-    def should_lazy_load(self, node: PageNode, segment_key: str):
+    def should_lazy_load(self, node: RouteNode, segment_key: str):
         return (
             node.loading is not None
             and self.resolve_type != "lacy"
@@ -383,43 +783,89 @@ class RoutingContext(BaseModel):
         """Peek at the last segment without removing"""
         return self.segments[-1] if self.segments else None
 
-    def consume_path_var(self, node: PageNode):
+    def consume_path_var(self, node: RouteNode):
         if not node.is_path_template:
             return None
 
-        if node.segment == REST_TOKEN:
+        if node.is_rest:
             rest_value = list(reversed(self.segments))
             self.segments = []
-            self.path_vars["rest"] = rest_value
+            self.set_path_var("rest", rest_value)
             return rest_value
         else:
             value = self.pop_segment()
             if value:
-                self.path_vars[node.segment] = value
+                self.set_path_var(node.segment, value)
             return value
 
-    def merge_segments(self, ignore_empty_folders: bool):
-        """Merge segments if empty folder should be ignored"""
-        if not ignore_empty_folders or len(self.segments) < 2:
-            _ = self.pop_segment()
-            return
-
-        first = self.segments.pop()
-        second = self.segments.pop()
-        combined = f"{first}/{second}"
-        self.segments.append(combined)
+    def drop_segments(self, count: int):
+        """Remove the last ``count`` segments consumed by a route key"""
+        if count:
+            del self.segments[-count:]
 
     async def gather_endpoints(self) -> EndpointResults:
         if not self.endpoints:
             return {}
 
+        if self.endpoint_dependencies:
+            futures = self.start_endpoints()
+            return {key: await futures[key] for key in self.endpoints}
+
         keys = list(self.endpoints.keys())
-        funcs = list(self.endpoints.values())
         results = await asyncio.gather(
-            *[func() for func in funcs], return_exceptions=True
+            *[self.call_endpoint(key) for key in keys], return_exceptions=True
         )
         return dict(zip(keys, results))
 
+    def start_endpoints(self) -> dict[str, "asyncio.Future[EndpointResult]"]:
+        """
+        Start all endpoints without waiting for them. Each future resolves to
+        the endpoint result or the raised exception. Endpoints with
+        dependencies start as soon as the results they depend on resolved,
+        independent endpoints start at once.
+        """
+        futures: dict[str, asyncio.Future[EndpointResult]] = {}
+
+        def start(key: str) -> asyncio.Future[EndpointResult]:
+            if key not in futures:
+                dependencies = {
+                    name: start(dependency_id)
+                    for name, dependency_id in self.endpoint_dependencies.get(key, {}).items()
+                }
+                call = self._call_after(key, dependencies) if dependencies else self.call_endpoint(key)
+                futures[key] = asyncio.ensure_future(_settle(call))
+            return futures[key]
+
+        for key in self.endpoints:
+            _ = start(key)
+        return futures
+
+    async def _call_after(
+        self, key: str, dependencies: dict[str, asyncio.Future[EndpointResult]]
+    ) -> EndpointResult:
+        results = dict[str, EndpointResult]()
+        for name, future in dependencies.items():
+            result = await future
+            if isinstance(result, BaseException):
+                raise EndpointDependencyError(
+                    f"Endpoint of {key} depends on {name}, which failed: {result}"
+                ) from result
+            results[name] = result
+        return await self.call_endpoint(key, results)
+
+    def call_endpoint(
+        self, key: str, dependency_results: dict[str, EndpointResult] | None = None
+    ) -> Awaitable[EndpointResult]:
+        """Call an endpoint, bounded by its route timeout and the request deadline"""
+        endpoint = self.endpoints[key]
+        if dependency_results:
+            endpoint = partial(endpoint, **dependency_results)
+
+        timeout = self.endpoint_timeouts.get(key)
+        if timeout is None and self.deadline is None:
+            return endpoint()
+        return call_with_deadline(endpoint, timeout, self.deadline, key)
+
     def to_loading_state_dict(self):
         """Convert context back to loading state dict for response"""
         return {**self.get_updated_loading_state(), "query_params": self.query_params}
@@ -432,10 +878,8 @@ class RoutingContext(BaseModel):
             if state.updated == True
         }
 
-    def set_silent_loading_states(self, node: PageNode, state: StateType = "done"):
+    def set_silent_loading_states(self, node: RouteNode, state: StateType = "done"):
         """Mark all descendant slots as done"""
-        for slot_name, slot_id in node.slots.items():
-            slot_node = RouteRegistry.get_node(slot_id)
-            if slot_node:
-                self.set_node_state(slot_node, state, slot_name)
-                self.set_silent_loading_states(slot_node, state)
+        for slot_name, slot_node in node.slots.items():
+            self.set_node_state(slot_node, state, slot_name)
+            self.set_silent_loading_states(slot_node, state)
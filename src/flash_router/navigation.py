@@ -1,5 +1,6 @@
 import re
 import json
+import hashlib
 from pathlib import Path
 from typing import TypeAlias, cast
 from pydantic import BaseModel
@@ -7,6 +8,9 @@ from pydantic import BaseModel
 
 RouteId: TypeAlias = str
 
+# Bump when the generated stub format changes, forces a rewrite of existing stubs
+STUB_FORMAT_VERSION = 1
+
 
 def url_for(
     route_id: RouteId,
@@ -176,8 +180,29 @@ def _build_navigation_stub(route_ids: list[str]) -> str:
     return "\n".join(lines) + "\n"
 
 
-def generate_navigation_typing(route_ids: list[str]) -> None:
+def _route_ids_digest(route_ids: list[str]) -> str:
+    payload = json.dumps([STUB_FORMAT_VERSION, sorted(route_ids)])
+    return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+
+
+def generate_navigation_typing(route_ids: list[str], root: Path | None = None) -> bool:
+    """
+    Write the url_for stubs for the route ids below ``root`` (defaults to the
+    working directory). The stubs are only rewritten when the route ids
+    changed since the last run, returns whether they were.
+    """
     canonical_route_ids = _canonicalize_route_ids(route_ids)
+    stub_package_path = (root or Path.cwd()) / ".flash_router_typing" / "flash_router"
+    digest_path = stub_package_path / ".route_ids.sha256"
+    stub_names = ("_route_types.pyi", "__init__.pyi", "navigation.pyi")
+
+    digest = _route_ids_digest(canonical_route_ids)
+    if (
+        digest_path.is_file()
+        and digest_path.read_text(encoding="utf-8") == digest
+        and all((stub_package_path / name).is_file() for name in stub_names)
+    ):
+        return False
 
     if canonical_route_ids:
         literals = ", ".join(
@@ -187,7 +212,6 @@ def generate_navigation_typing(route_ids: list[str]) -> None:
     else:
         content = "from typing import Literal\n\nRouteId = Literal[\"\"]\n"
 
-    stub_package_path = Path.cwd() / ".flash_router_typing" / "flash_router"
     stub_package_path.mkdir(parents=True, exist_ok=True)
 
     route_types_stub_path = stub_package_path / "_route_types.pyi"
@@ -204,6 +228,10 @@ def generate_navigation_typing(route_ids: list[str]) -> None:
     navigation_stub = _build_navigation_stub(canonical_route_ids)
     _ = navigation_stub_path.write_text(navigation_stub, encoding="utf-8")
 
+    # Written last, interrupted runs are repeated on the next start
+    _ = digest_path.write_text(digest, encoding="utf-8")
+    return True
+
 
 def _model_to_params(params_or_model: BaseModel | None) -> dict[str, object]:
     if params_or_model is None:
@@ -1,10 +1,14 @@
-from importlib.util import spec_from_file_location, module_from_spec
+from collections.abc import AsyncIterator, Callable
+from concurrent.futures import ThreadPoolExecutor
 from typing import Literal, Any, cast
 from pathlib import Path
+from types import ModuleType
+import asyncio
 import json
 import os
+import threading
+import time
 import traceback
-import sys
 
 from dash import html
 from dash._hooks import HooksManager
@@ -12,24 +16,38 @@ from dash._get_paths import app_strip_relative_path
 from dash._utils import inputs_to_vals
 from dash._validate import validate_and_group_input_args
 from dash.development.base_component import Component
-from flash import Flash, Input, Output, State, MATCH, callback
+from flash import Flash, Input, Output, State, MATCH, callback, clientside_callback
 from flash._pages import _parse_query_string, _infer_module_name
-from quart import request
+from quart import Response, current_app, has_request_context, request
 
-from .utils.constants import DEFAULT_LAYOUT_TOKEN
 from .utils.helper_functions import (
     format_relative_path,
+    gather_limited,
     path_to_module,
     recursive_to_plotly_json,
     _invoke_layout,
 )
 
-from .types import Endpoint, ErrorLayout, Layout, QueryParams, PathVariables
+from .utils.constants import ROUTE_FILES
+from .types import Endpoint, ErrorLayout, ExecutionMode, Layout, QueryParams, PathVariables
+from .client import RESOLVE_ROUTE, resolve_handler
 from .components import ChildContainer, LacyContainer, RootContainer, SlotContainer
 from .navigation import generate_navigation_typing
-from .core.routing import LoadingState, PageNode, RouteConfig, RouterResponse, RoutingContext, RouteRegistry
+from .core.routing import PageNode, RouteConfig, RouteNode, RouterResponse, RoutingContext, RouteRegistry
 from .core.query_params import extract_function_inputs
 from .core.execution import ExecNode
+from .core.manifest import (
+    ManifestEntry,
+    create_manifest_entry,
+    pages_fingerprint,
+    read_manifest,
+    write_manifest,
+)
+from .core.modules import RouteModuleCache, read_static_config
+from .core.plans import ResolutionPlanCache
+from .core.fragments import FragmentCache
+from .core.endpoints import EndpointCache, single_flight
+from .core.executors import SyncExecutor
 from ._validation import (
     RouteConfigConflictError,
     RouteLayoutMissingError,
@@ -37,6 +55,29 @@ from ._validation import (
     validate_tree,
 )
 
+
+def _json_response(response: RouterResponse, typed_array_threshold: int | None) -> Response:
+    return Response(response.to_json(typed_array_threshold), mimetype=response.mimetype)
+
+
+def _session_cookie() -> str | None:
+    """Session cookie of the current request, the default session id of the endpoint cache"""
+    if not has_request_context():
+        return None
+    return request.cookies.get(current_app.config.get("SESSION_COOKIE_NAME") or "session")
+
+
+async def _ndjson_stream(
+    responses: AsyncIterator[RouterResponse], typed_array_threshold: int | None
+) -> AsyncIterator[bytes]:
+    async for response in responses:
+        yield response.to_json(typed_array_threshold) + b"\n"
+
+
+def _unloaded_layout(**kwargs: Any) -> Component:
+    raise RuntimeError("Route module is not loaded yet")
+
+
 class Router:
     def __init__(
         self,
@@ -44,11 +85,77 @@ class Router:
         pages_folder: str = "pages",
         requests_pathname_prefix: str | None = None,
         ignore_empty_folders: bool = False,
+        strict_validation: bool = False,
+        plan_cache_size: int = 256,
+        max_concurrent_renders: int | None = None,
+        import_workers: int | None = None,
+        lazy_imports: bool = False,
+        prewarm: bool = False,
+        manifest_path: str | None = None,
+        navigation_typing: bool = True,
+        navigation_typing_background: bool = True,
+        resolve_endpoint: bool = False,
+        stream_responses: bool = False,
+        typed_array_threshold: int | None = 256,
+        fragment_cache_size: int = 1024,
+        endpoint_cache_bytes: int = 64 * 2**20,
+        session_id: Callable[[], str | None] | None = None,
+        coalesce_endpoints: bool = False,
+        request_timeout: float | None = None,
+        sync_execution: ExecutionMode = "inline",
+        sync_workers: int | None = None,
+        process_workers: int | None = None,
     ) -> None:
         self.app = app
         self.requests_pathname_prefix = requests_pathname_prefix
         self.ignore_empty_folders = ignore_empty_folders
+        # Validate the client loading state store on every request (debug aid)
+        self.strict_validation = strict_validation
+        self.plan_cache = ResolutionPlanCache(maxsize=plan_cache_size)
+        # Upper bound for execution trees rendered in parallel on search updates
+        self.max_concurrent_renders = max_concurrent_renders
         self.pages_folder = app.pages_folder if app.pages_folder else pages_folder
+        self.route_modules = RouteModuleCache()
+        # Route modules are imported on a worker pool before registration if > 1
+        self.import_workers = import_workers
+        # Route modules are imported when their node is first resolved
+        self.lazy_imports = lazy_imports
+        self.prewarm = prewarm
+        self._lazy_routes: dict[str, tuple[str, str, PageNode | None]] = {}
+        # Registry metadata is restored from the manifest while the pages are unchanged
+        self.manifest_path = manifest_path
+        self._manifest_entries = list[ManifestEntry]()
+        # url_for stubs are a development aid, rewritten only when the routes changed.
+        # Production deployments (e.g. read-only filesystems) disable them
+        self.navigation_typing = navigation_typing
+        self.navigation_typing_background = navigation_typing_background
+        # Subtrees of a URL are streamed to the client as they complete (needs the endpoint)
+        self.stream_responses = stream_responses
+        # Navigations are posted to a dedicated route instead of the Dash callback
+        self.resolve_endpoint = resolve_endpoint or stream_responses
+        # Numeric figure arrays from this size on are sent base64 encoded, None opts out
+        self.typed_array_threshold = typed_array_threshold
+        # Rendered subtrees of routes with a fragment_cache config
+        self.fragment_cache = FragmentCache(
+            maxsize=fragment_cache_size, typed_array_threshold=typed_array_threshold
+        )
+        # Endpoint results of routes with an endpoint_cache config, bounded by their size
+        self.endpoint_cache = EndpointCache(
+            maxbytes=endpoint_cache_bytes, session_id=session_id or _session_cookie
+        )
+        # Identical endpoint calls of concurrent requests share one call (process wide)
+        self.coalesce_endpoints = coalesce_endpoints
+        # Seconds all endpoints of a request get, overruns render their error layout
+        self.request_timeout = request_timeout
+        # Synchronous layouts and endpoints run inline by default, "thread" opts into a
+        # bounded thread pool (thread locals and request globals are not available there),
+        # layouts of routes in process mode run on a process pool
+        self.sync_execution = sync_execution
+        self.sync_executor = SyncExecutor(
+            max_workers=sync_workers,
+            process_workers=process_workers,
+            typed_array_threshold=typed_array_threshold,
+        )
 
         if not isinstance(self.app, Flash): # pyright: ignore[reportUnnecessaryIsInstance]
             raise TypeError(f"App needs to be of Flash not: {type(self.app)}")
@@ -70,9 +177,58 @@ class Router:
                 f"Current working directory: {self.pages_folder}\n"
             ))
 
-        self._traverse_directory(str(app_dir), self.pages_folder, None)
-        validate_tree(RouteRegistry._nodes)
-        generate_navigation_typing(sorted(RouteRegistry._nodes.keys()))
+        pages_dir = os.path.join(str(app_dir), self.pages_folder)
+        fingerprint = pages_fingerprint(pages_dir) if self.manifest_path else ""
+        manifest_entries = (
+            read_manifest(self.manifest_path, fingerprint) if self.manifest_path else None
+        )
+
+        if manifest_entries is not None:
+            self._restore_route_tree(pages_dir, manifest_entries)
+        else:
+            if self.import_workers and self.import_workers > 1 and not self.lazy_imports:
+                route_files = self._discover_route_files(pages_dir)
+                self.preload_route_modules(route_files)
+
+            self._traverse_directory(str(app_dir), self.pages_folder, None)
+            validate_tree(RouteRegistry._nodes)
+            if self.manifest_path:
+                _ = write_manifest(self.manifest_path, fingerprint, self._manifest_entries)
+
+        RouteRegistry.compile(self.ignore_empty_folders)
+        if self.navigation_typing:
+            self.update_navigation_typing()
+
+        if self.lazy_imports:
+            RouteRegistry.set_node_loader(self._load_lazy_node)
+            if self.prewarm:
+                _ = self.prewarm_routes()
+
+    def update_navigation_typing(self) -> threading.Thread | None:
+        """Refresh the url_for stubs, off the startup path in background mode"""
+        route_ids = sorted(RouteRegistry._nodes.keys())
+        # Resolved here, the working directory may change before the thread runs
+        root = Path.cwd()
+        if not self.navigation_typing_background:
+            _ = self._write_navigation_typing(route_ids, root)
+            return None
+
+        thread = threading.Thread(
+            target=self._write_navigation_typing,
+            args=(route_ids, root),
+            name="flash-router-typing",
+            daemon=True,
+        )
+        thread.start()
+        return thread
+
+    def _write_navigation_typing(self, route_ids: list[str], root: Path) -> bool:
+        try:
+            return generate_navigation_typing(route_ids, root)
+        except OSError as error:
+            # e.g. read-only container filesystems, stubs are a development aid only
+            self.app.logger.warning("Navigation stubs were not written to %s: %s", root, error)
+            return False
 
     def _traverse_directory(
         self,
@@ -89,9 +245,19 @@ class Router:
         dir_has_page = "page.py" in entries
 
         if dir_has_page:
-            new_node = self.load_route_module(current_dir, segment, current_node)
+            new_node = (
+                self.scan_route_module(current_dir, segment, current_node)
+                if self.lazy_imports
+                else self.load_route_module(current_dir, segment, current_node)
+            )
             RouteRegistry.register_node(new_node, current_node)
             next_node = new_node
+
+            if self.manifest_path:
+                directory = os.path.relpath(current_dir, self.pages_folder)
+                self._manifest_entries.append(create_manifest_entry(
+                    new_node, segment, [] if directory == "." else directory.split(os.sep)
+                ))
         else:
             next_node = current_node
 
@@ -103,10 +269,111 @@ class Router:
             if os.path.isdir(full_path):
                 self._traverse_directory(current_dir, entry, next_node)
 
-    def load_route_module(
+    def _restore_route_tree(self, pages_dir: str, entries: list[ManifestEntry]) -> None:
+        """
+        Register the nodes of an unchanged pages folder from the manifest.
+        Traversal, input analysis and tree validation are skipped, only the
+        route modules are imported (or deferred in lazy mode).
+        """
+        nodes = dict[str, PageNode]()
+        for entry in entries:
+            current_dir = os.path.join(pages_dir, *entry["directory"])
+            parent_node = nodes.get(entry["parent_id"]) if entry["parent_id"] else None
+            endpoint_inputs = entry["endpoint_inputs"]
+
+            if self.lazy_imports:
+                new_node = self._create_placeholder_node(
+                    current_dir,
+                    entry["segment"],
+                    parent_node,
+                    is_static=entry["is_static"],
+                    default_child=entry["default_child"],
+                    endpoint_inputs=set(endpoint_inputs or ()),
+                )
+            else:
+                new_node = self.load_route_module(
+                    current_dir,
+                    entry["segment"],
+                    parent_node,
+                    endpoint_inputs=set(endpoint_inputs) if endpoint_inputs is not None else None,
+                )
+
+            RouteRegistry.register_node(new_node, parent_node)
+            nodes[new_node.node_id] = new_node
+
+    def scan_route_module(
         self, current_dir: str, segment: str, parent_node: PageNode | None
+    ) -> PageNode:
+        """
+        Create a placeholder Page Node from the folder structure and the static
+        route config. Routes whose config is computed at import time are loaded.
+        """
+        static_config = read_static_config(os.path.join(current_dir, "page.py"))
+        if static_config is None:
+            return self.load_route_module(current_dir, segment, parent_node)
+
+        return self._create_placeholder_node(
+            current_dir,
+            segment,
+            parent_node,
+            is_static=bool(static_config.get("is_static")),
+            default_child=static_config.get("default_child"),
+        )
+
+    def _create_placeholder_node(
+        self,
+        current_dir: str,
+        segment: str,
+        parent_node: PageNode | None,
+        is_static: bool,
+        default_child: str | None,
+        endpoint_inputs: set[str] | None = None,
+    ) -> PageNode:
+        relative_path = os.path.relpath(current_dir, self.pages_folder)
+        relative_path = format_relative_path(relative_path)
+        is_static = is_static or relative_path == "/"
+        is_root = parent_node and parent_node.segment == "/"
+
+        self._lazy_routes[relative_path] = (current_dir, segment, parent_node)
+        return PageNode(
+            _segment=relative_path if is_static else segment,
+            node_id=relative_path,
+            layout=_unloaded_layout,
+            parent_id=parent_node.node_id if parent_node else None,
+            module=path_to_module(relative_path, "page.py"),
+            is_root=is_root,
+            path=relative_path,
+            is_static=is_static,
+            default_child=default_child,
+            endpoint_inputs=endpoint_inputs or set(),
+            is_loaded=False,
+        )
+
+    def _load_lazy_node(self, node_id: str) -> PageNode:
+        current_dir, segment, parent_node = self._lazy_routes[node_id]
+        page_node = self.load_route_module(current_dir, segment, parent_node)
+        del self._lazy_routes[node_id]
+        return page_node
+
+    def prewarm_routes(self) -> threading.Thread:
+        """Import the route modules of all placeholder nodes on a background thread"""
+
+        def prewarm():
+            for node in RouteRegistry.unloaded_nodes():
+                RouteRegistry.ensure_loaded(node)
+
+        thread = threading.Thread(target=prewarm, name="flash-router-prewarm", daemon=True)
+        thread.start()
+        return thread
+
+    def load_route_module(
+        self,
+        current_dir: str,
+        segment: str,
+        parent_node: PageNode | None,
+        endpoint_inputs: set[str] | None = None,
     ):
-        """Load modules and create Page Node"""
+        """Load modules and create Page Node, known endpoint inputs skip the input analysis"""
         relative_path = os.path.relpath(current_dir, self.pages_folder)
         relative_path = format_relative_path(relative_path)
         page_module_name = path_to_module(relative_path, "page.py")
@@ -161,9 +428,29 @@ class Router:
             )
 
         endpoint = cast(Endpoint | None, self.import_route_component(current_dir, "api.py", "endpoint"))
-        endpoint_inputs, _ = extract_function_inputs(endpoint)
-        layout_inputs, _ = extract_function_inputs(page_layout)
-        inputs = set(endpoint_inputs + layout_inputs)
+        # Keywords receiving ancestor endpoint results are no request inputs
+        endpoint_depends = {
+            name: format_relative_path(path)
+            for name, path in (route_config.endpoint_depends or {}).items()
+        }
+        if endpoint_inputs is None:
+            api_inputs, _ = extract_function_inputs(endpoint, exclude=endpoint_depends)
+            layout_inputs, _ = extract_function_inputs(page_layout)
+            endpoint_inputs = set(api_inputs + layout_inputs)
+
+        # Synchronous callables are wrapped once here instead of checked per request
+        execution = route_config.execution or self.sync_execution
+        if execution == "process":
+            route_files = [
+                (_infer_module_name(path), path)
+                for path in (os.path.join(current_dir, "page.py"), os.path.join(current_dir, "api.py"))
+                if os.path.exists(path)
+            ]
+            page_layout = self.sync_executor.wrap_process(page_layout, route_files)
+        else:
+            page_layout = self.sync_executor.wrap(page_layout, execution)
+        default_layout = self.sync_executor.wrap(default_layout, execution)
+        endpoint = self.sync_executor.wrap(endpoint, execution, awaitable=True)
 
         node_id = relative_path
         new_node = PageNode(
@@ -177,7 +464,11 @@ class Router:
             error=error_layout,
             loading=loading_layout,
             endpoint=endpoint,
-            endpoint_inputs=inputs,
+            endpoint_inputs=endpoint_inputs,
+            fragment_cache=route_config.fragment_cache,
+            endpoint_cache=route_config.endpoint_cache,
+            endpoint_timeout=route_config.endpoint_timeout,
+            endpoint_depends=endpoint_depends,
             path=relative_path,
             is_static=is_static,
             default_child=route_config.default_child,
@@ -188,6 +479,64 @@ class Router:
     def strip_relative_path(self, path: str) -> str:
         return app_strip_relative_path(self.app.config.requests_pathname_prefix, path) # pyright: ignore[reportReturnType,reportUnknownArgumentType]
 
+    def _load_route_file(self, page_path: str) -> ModuleType:
+        page_module_name = _infer_module_name(page_path)
+        try:
+            return self.route_modules.load(page_module_name, page_path)
+        except Exception as e:
+            raise RouteModuleImportError((
+                "Failed to import route module "
+                f"{page_module_name} from {page_path}: "
+                f"{e.__class__.__name__}: {e}"
+            )) from e
+
+    def _discover_route_files(self, current_dir: str) -> list[str]:
+        """Collects the route files in traversal order without importing them."""
+        route_files = list[str]()
+        if not os.path.exists(current_dir):
+            return route_files
+
+        entries = os.listdir(current_dir)
+        if "page.py" in entries:
+            route_files.extend(
+                os.path.join(current_dir, file_name)
+                for file_name in ROUTE_FILES
+                if file_name in entries
+            )
+
+        for entry in sorted(entries):
+            if entry.startswith((".", "_")) or entry == "page.py":
+                continue
+
+            full_path = os.path.join(current_dir, entry)
+            if os.path.isdir(full_path):
+                route_files.extend(self._discover_route_files(full_path))
+
+        return route_files
+
+    def preload_route_modules(self, route_files: list[str]) -> list[tuple[str, float]]:
+        """
+        Imports the route files on a worker pool. Failures are raised in
+        traversal order, so the reported error matches the sequential import.
+        Returns the slowest imports (file, seconds), which are logged as well.
+        """
+        with ThreadPoolExecutor(max_workers=self.import_workers) as executor:
+            futures = [executor.submit(self._load_route_file, path) for path in route_files]
+
+        for future in futures:
+            _ = future.result()
+
+        slowest = self.route_modules.slowest_imports()
+        if slowest:
+            self.app.logger.info(
+                "Slowest route module imports:\n%s",
+                "\n".join(
+                    f"  {seconds * 1000:8.1f} ms  {os.path.relpath(path, self.pages_folder)}"
+                    for path, seconds in slowest
+                ),
+            )
+        return slowest
+
     def import_route_component(
         self,
         current_dir: str,
@@ -209,26 +558,10 @@ class Router:
             return None
 
         page_module_name = _infer_module_name(page_path)
-
-        try:
-            spec = spec_from_file_location(page_module_name, page_path)
-            if spec is None or spec.loader is None:
-                raise ImportError(f"Cannot create spec for {page_path}")
-
-            module = module_from_spec(spec)
-            spec.loader.exec_module(module)
-        except Exception as e:
-            raise RouteModuleImportError((
-                "Failed to import route module "
-                f"{page_module_name} from {page_path}: "
-                f"{e.__class__.__name__}: {e}"
-            )) from e
+        module = self._load_route_file(page_path)
 
         layout = getattr(module, component_name, None)
 
-        if page_module_name not in sys.modules:
-            sys.modules[page_module_name] = module
-
         if (
             file_name in {"page.py", "default.py"}
             and not layout
@@ -243,96 +576,34 @@ class Router:
 
     def build_execution_tree(
         self,
-        current_node: PageNode | None,
+        current_node: RouteNode | None,
         ctx: RoutingContext,
     ) -> ExecNode | None:
         """
-        Recursively builds the execution tree for the matched route.
-        It extracts any path variables, processes child nodes, and handles slot nodes.
+        Builds the execution tree for the matched route.
+        The resolution plan for the route shape is taken from the plan cache
+        and only the path variables of this request are bound into it.
+        Subtrees found in the fragment cache replace their execution.
         """
 
         if not current_node:
             return current_node
 
-        next_segment = ctx.peek_segment()
-        segment_key = current_node.create_segment_key(next_segment)
-        is_lacy = ctx.should_lazy_load(current_node, segment_key)
-        layout = current_node.layout
-        if (
-            current_node.is_path_template
-            and DEFAULT_LAYOUT_TOKEN in segment_key
-            and current_node.default_layout is not None
-        ):
-            layout = current_node.default_layout
-
-        if current_node.is_path_template:
-            _ = ctx.consume_path_var(current_node)
-            next_segment = ctx.peek_segment()
-
-        exec_node = ExecNode(
-            segment=segment_key,
-            node_id=current_node.node_id,
-            layout=layout,
-            parent_id=current_node.parent_id,
-            variables=ctx.variables,
-            loading=current_node.loading,
-            error=current_node.error,
-            is_lacy=is_lacy,
-        )
-
-        if is_lacy:
-            ctx.set_node_state(current_node, "done", segment_key)
-            return exec_node
-
-        if current_node.endpoint and DEFAULT_LAYOUT_TOKEN not in segment_key:
-            ctx.add_endpoint(current_node)
-
-        if current_node.child_nodes or current_node.path_template:
-            child_node = current_node.get_child_node(next_segment)
-
-            if not child_node or not child_node.is_path_template:
-                _ = ctx.pop_segment()
-
-            child_exec = self.build_execution_tree(
-                current_node=child_node,
-                ctx=ctx,
-            )
-
-            exec_node.child_node = child_exec
-
-        if current_node.slots:
-            exec_node.slots = self._process_slot_nodes(
-                current_node=current_node,
-                ctx=ctx,
-            )
-
-        ctx.set_node_state(current_node, "done", segment_key)
-        return exec_node
+        plan = self.plan_cache.get_plan(current_node, ctx)
+        exec_tree = plan.bind(ctx)
+        if self.request_timeout is not None and ctx.deadline is None:
+            ctx.deadline = time.monotonic() + self.request_timeout
+        self.fragment_cache.attach(exec_tree, ctx)
+        return exec_tree
 
-    def _process_slot_nodes(
-        self,
-        current_node: PageNode,
-        ctx: RoutingContext,
-    ):
-        """Processes all slot nodes defined on the current node."""
-        slot_exec_nodes: dict[str, ExecNode | None] = {}
-        for slot_name, slot_id in current_node.slots.items():
-            slot_node = RouteRegistry.get_node(slot_id)
-            if not slot_node:
-                self.app.logger.error(f"Slot node with id {slot_id} not found for slot '{slot_name}' in node {current_node.node_id}")
-                continue
-
-            segment_key = slot_node.create_segment_key(None)
-            ctx.set_node_state(slot_node, "done", segment_key)
-
-            slot_exec_node = self.build_execution_tree(
-                current_node=slot_node,
-                ctx=ctx,
-            )
-
-            slot_exec_nodes[slot_name] = slot_exec_node
-
-        return slot_exec_nodes
+    def prepare_endpoints(self, ctx: RoutingContext) -> None:
+        """
+        Replace the endpoints of routes with an endpoint cache by cached calls,
+        coalesced with identical calls in flight if enabled. Called once per
+        request after all execution trees are built, right before the endpoints
+        are gathered.
+        """
+        self.endpoint_cache.attach(ctx, single_flight if self.coalesce_endpoints else None)
 
     # ─── RESPONSE BUILDER ─────────────────────────────────────
     async def resolve_url(
@@ -348,10 +619,12 @@ class Router:
             query_params=query_parameters,
             loading_state_dict=loading_state,
             resolve_type="url",
+            strict=self.strict_validation,
         )
 
         static_route, path_variables = RouteRegistry.get_static_route(ctx)
         if static_route:
+            RouteRegistry.ensure_loaded(static_route)
             layout = await _invoke_layout(
                 static_route.layout, **query_parameters, **path_variables # pyright: ignore[reportArgumentType]
             )
@@ -370,6 +643,7 @@ class Router:
         if not exec_tree:
             return self.build_response(node=None, loading_states={})
 
+        self.prepare_endpoints(ctx)
         result_data = await ctx.gather_endpoints()
         final_layout = await exec_tree.execute(result_data)
         new_loading_state = ctx.to_loading_state_dict()
@@ -397,77 +671,55 @@ class Router:
             loading_state_dict=loading_state,
             query_params=query_params,
             resolve_type="search",
+            strict=self.strict_validation,
         )
 
-        # Collect all eligible nodes (nodes whose endpoint inputs match updated query parameters)
-        eligible_nodes: list[PageNode] = []
-        for _, loaded_node in ctx.loading_states.items():
-            node_id = loaded_node.node_id
-            node = RouteRegistry.get_node(node_id)
-            if node is None:
-                self.app.logger.error(
-                    f"Node with id {node_id} not found in RouteRegistry during search resolution."
-                )
-                continue
-
-            if any(
-                node_input in updated_query_parameters
-                for node_input in node.endpoint_inputs
-            ):
-                eligible_nodes.append(node)
-
-        if not eligible_nodes:
+        # Nodes consuming an updated query parameter that are mounted on the client.
+        # A node always consumes the parameter it was selected for, so it is
+        # re-rendered itself instead of walking up to a consuming parent.
+        mounted_node_ids = {state.node_id for state in ctx.loading_states.values()}
+        # Inputs of lazy placeholder nodes are indexed once their modules are loaded
+        for node_id in mounted_node_ids:
+            if (mounted_node := RouteRegistry.get_node(node_id)) is not None:
+                RouteRegistry.ensure_loaded(mounted_node)
+
+        nodes_to_process = [
+            node
+            for node in RouteRegistry.get_input_consumers(updated_query_parameters)
+            if node.node_id in mounted_node_ids
+        ]
+
+        if not nodes_to_process:
             return None
 
-        # Find parent nodes and create a set of nodes to process
-        nodes_to_process_ids = set[str]()
-        for node in eligible_nodes:
-            current: PageNode | None = node
-            while current:
-                # If we find a parent that needs to be processed, add it and stop traversing
-                if any(
-                    parent_input in updated_query_parameters
-                    for parent_input in current.endpoint_inputs
-                ):
-                    nodes_to_process_ids.add(current.node_id)
-                    break
-                current = (
-                    RouteRegistry.get_node(current.parent_id)
-                    if current.parent_id
-                    else None
-                )
-
-        # If no parent nodes need processing, process the eligible nodes directly
-        if not nodes_to_process_ids:
-            nodes_to_process_ids = {node.node_id for node in eligible_nodes}
-
         # Build execution trees for all selected nodes
         exec_trees: list[ExecNode] = []
-        nodes_to_process: list[PageNode] = []
-        for node_id in nodes_to_process_ids:
-            node = RouteRegistry.get_node(node_id)
-            if node is None:
-                self.app.logger.error(
-                    f"Node with id {node_id} not found in RouteRegistry during search resolution."
-                )
-                continue
-
+        processed_nodes: list[RouteNode] = []
+        for node in nodes_to_process:
             exec_tree = self.build_execution_tree(
                 current_node=node,
                 ctx=ctx,
             )
             if exec_tree:
                 exec_trees.append(exec_tree)
-                nodes_to_process.append(node)
+                processed_nodes.append(node)
 
         # Gather all endpoints once
+        self.prepare_endpoints(ctx)
         endpoint_results = await ctx.gather_endpoints()
 
-        # Execute all trees with the same endpoint results
+        # Execute all trees concurrently with the same endpoint results
+        results = await gather_limited(
+            *[exec_tree.execute(endpoint_results) for exec_tree in exec_trees],
+            limit=self.max_concurrent_renders,
+            return_exceptions=True,
+        )
+
         layouts = list[Component]()
-        nodes = list[PageNode]()
-        for exec_tree, node in zip(exec_trees, nodes_to_process):
-            layout = await exec_tree.execute(endpoint_results)
+        nodes = list[RouteNode]()
+        for exec_tree, node, layout in zip(exec_trees, processed_nodes, results):
+            if isinstance(layout, Exception):
+                layout = await exec_tree.handle_error(layout, exec_tree.variables)
             if layout:
                 layouts.append(layout)
                 nodes.append(node)
@@ -481,49 +733,217 @@ class Router:
         return self.build_multi_response(nodes, new_loading_state, layouts) # pyright: ignore[reportArgumentType]
 
 
-    def build_response(
+    async def resolve_navigation(
         self,
-        node: PageNode | None,
-        loading_states: dict[str, PathVariables],
-        layout: Component | None = None,
-        remove_layout: bool = False,
-        is_redirect: bool = False
-    ):
+        prop: str | None,
+        pathname: str,
+        search: str,
+        loading_state: dict[str, Any],
+        inputs: dict[str, Any],
+    ) -> RouterResponse | None:
+        """Resolve a location change of the router, shared by the callback hook and the endpoint"""
+        query_parameters = _parse_query_string(search)
+        previous_qp = loading_state.pop("query_params", {})
+        _ = loading_state.pop("is_redirect", False)
+        variables = {**query_parameters, **inputs}
+
+        if prop == "pathname":
+            try:
+                return await self.resolve_url(pathname, variables, loading_state)
+            except Exception:
+                print(f"Traceback: {traceback.format_exc()}")
+                raise Exception("Failed to resolve the URL")
+
+        if prop == "search":
+            updated = dict(set(query_parameters.items()) - set(previous_qp.items()))
+            missing_keys = previous_qp.keys() - query_parameters.keys()
+            missing = {
+                key: None
+                for key in missing_keys
+                if key not in self.app.routing_callback_inputs
+            }
+            updates = dict(updated.items() | missing.items())
+            return await self.resolve_search(pathname, variables, updates, loading_state)
+
+        return None
+
+    async def resolve_lacy(
+        self,
+        node_id: str,
+        variables: str,
+        pathname: str,
+        search: str,
+        loading_state: dict[str, Any],
+    ) -> Any:
+        """
+        Render the subtree of a lacy node for its container. The layout is
+        returned as plain JSON types, cached fragments and layouts rendered in
+        a process can not be encoded by the callback serializer of Dash.
+        """
+        qs = _parse_query_string(search)
+        query_parameters = loading_state.pop("query_params", {})
+        _ = loading_state.pop("is_redirect", False)
+        node_variables = json.loads(variables)
+        variables = {**qs, **query_parameters, **node_variables}
+        lacy_node = RouteRegistry.get_node(node_id)
+        path = self.strip_relative_path(pathname)
+        segments = path.split("/")
+        node_segments = lacy_node.module.split(".")[:-1]
+        current_index = node_segments.index(
+            lacy_node.segment_value.replace("_", "-")
+        )
+        remaining_segments = list(reversed(segments[current_index:]))
+
+        ctx = RoutingContext.from_request(
+            pathname=pathname,
+            query_params=variables,
+            loading_state_dict=loading_state,
+            resolve_type="lacy",
+            strict=self.strict_validation,
+        )
+
+        ctx.segments = remaining_segments
+
+        exec_tree = self.build_execution_tree(
+            current_node=lacy_node,
+            ctx=ctx,
+        )
+
+        self.prepare_endpoints(ctx)
+        endpoint_results = await ctx.gather_endpoints()
+        layout = await exec_tree.execute(endpoint_results)
+        return recursive_to_plotly_json(layout)
+
+    def get_container_id(self, node: RouteNode | None, remove_layout: bool = False) -> str:
+        """Id of the container the layout of the node is rendered into"""
         match node:
             case None:
-                container_id = RootContainer.ids.container
-                layout = html.H1("404 - Page not found")
-                loading_states = {}
+                return RootContainer.ids.container
 
             case _ if node.is_root or node.is_static:
-                container_id = (
+                return (
                     RootContainer.ids.container
                     if not remove_layout
                     else json.dumps(ChildContainer.ids.container(node.node_id))
                 )
 
             case _ if node.is_slot:
-                container_id = json.dumps(
+                return json.dumps(
                     SlotContainer.ids.container(node.parent_id, node.segment) # pyright: ignore[reportArgumentType]
                 )
 
             case _:
-                container_id = json.dumps(
+                return json.dumps(
                     ChildContainer.ids.container(
                         node.parent_id if not remove_layout else node.node_id # pyright: ignore[reportArgumentType]
                     )
                 )
 
-        rendered_layout = recursive_to_plotly_json(layout)
+    async def stream_url(
+        self,
+        pathname: str,
+        query_parameters: QueryParams,
+        loading_state: dict[str, PathVariables],
+    ) -> AsyncIterator[RouterResponse]:
+        """
+        Resolve a URL as a sequence of responses. The first one holds the active
+        layout with empty slot and child containers and the new loading state,
+        every subtree follows as soon as its endpoint and layout completed.
+        """
+        path = self.strip_relative_path(pathname)
+        ctx = RoutingContext.from_request(
+            pathname=path,
+            query_params=query_parameters,
+            loading_state_dict=loading_state,
+            resolve_type="url",
+            strict=self.strict_validation,
+        )
+
+        active_node = None
+        if not RouteRegistry.get_static_route(ctx)[0]:
+            active_node = RouteRegistry.get_active_root_node(ctx, self.ignore_empty_folders)
+        exec_tree = self.build_execution_tree(current_node=active_node, ctx=ctx)
+
+        if not exec_tree:
+            # Static routes and unknown URLs render in a single response
+            yield await self.resolve_url(pathname, query_parameters, loading_state)
+            return
+
+        self.prepare_endpoints(ctx)
+        loading_states = {**ctx.to_loading_state_dict(), "is_redirect": False}
+        queue = asyncio.Queue[tuple[str, Component]]()
+
+        endpoint_futures = ctx.start_endpoints()
+
+        async def render():
+            try:
+                await exec_tree.stream(
+                    self.get_container_id(active_node), endpoint_futures, queue
+                )
+            finally:
+                await queue.put(None) # pyright: ignore[reportArgumentType]
+
+        producer = asyncio.create_task(render())
+        try:
+            while (patch := await queue.get()) is not None:
+                container_id, layout = patch
+                response: dict[str, Any] = {container_id: {"children": layout}}
+                if loading_states:
+                    response[RootContainer.ids.state_store] = {"data": loading_states}
+                    loading_states = {}
+                yield RouterResponse(multi=True, response=response)
+            await producer
+        finally:
+            # The client may disconnect mid-stream, endpoints still running are of no use
+            _ = producer.cancel()
+            for future in endpoint_futures.values():
+                _ = future.cancel()
+
+    async def stream_navigation(
+        self,
+        prop: str | None,
+        pathname: str,
+        search: str,
+        loading_state: dict[str, Any],
+        inputs: dict[str, Any],
+    ) -> AsyncIterator[RouterResponse]:
+        """Streaming variant of resolve_navigation, only URL changes are streamed"""
+        if prop != "pathname":
+            response = await self.resolve_navigation(prop, pathname, search, loading_state, inputs)
+            yield response or RouterResponse(multi=True, response={})
+            return
+
+        query_parameters = _parse_query_string(search)
+        _ = loading_state.pop("query_params", {})
+        _ = loading_state.pop("is_redirect", False)
+        async for response in self.stream_url(
+            pathname, {**query_parameters, **inputs}, loading_state
+        ):
+            yield response
+
+    def build_response(
+        self,
+        node: RouteNode | None,
+        loading_states: dict[str, PathVariables],
+        layout: Component | None = None,
+        remove_layout: bool = False,
+        is_redirect: bool = False
+    ):
+        if node is None:
+            layout = html.H1("404 - Page not found")
+            loading_states = {}
+
+        container_id = self.get_container_id(node, remove_layout)
         loading_states["is_redirect"] = is_redirect # pyright: ignore[reportArgumentType]
+        # Layouts stay components, they are serialized once when the response is sent
         response = {
-            container_id: {"children": rendered_layout},
+            container_id: {"children": layout},
             RootContainer.ids.state_store: {"data": loading_states},
         }
         return RouterResponse(multi=True, response=response) # pyright: ignore[reportUnknownArgumentType]
 
     def build_multi_response(
-        self, nodes: list[PageNode], loading_states: dict[str, PathVariables], layouts: list[Component], is_redirect: bool = False
+        self, nodes: list[RouteNode], loading_states: dict[str, PathVariables], layouts: list[Component], is_redirect: bool = False
     ) -> RouterResponse:
         """Builds a response containing multiple layout updates with a single state store."""
         if not nodes or not layouts:
@@ -539,10 +959,18 @@ class Router:
 
     # ─── ASYNC & SYNC ROUTER SETUP ───────────────────────────────────────────────────
     def setup_router(self) -> None:
+        update_component_path = "_dash-update-component"
+        location_marker = json.dumps(f"{RootContainer.ids.location}.")[:-1].encode()
+
         @self.app.server.before_request
         async def router():
+            # Only callbacks triggered by the router location are handled, other
+            # requests leave before their body is read or decoded
+            if request.method != "POST" or not request.path.endswith(update_component_path):
+                return
+
             request_data = await request.get_data()
-            if not request_data:
+            if not request_data or location_marker not in request_data:
                 return
 
             body = json.loads(request_data)
@@ -571,38 +999,60 @@ class Router:
                 pathname_, search_, loading_state_ = args
                 states_ = {}
 
-            query_parameters = _parse_query_string(search_)
-            previous_qp = loading_state_.pop("query_params", {})
-            is_redirect = loading_state_.pop("is_redirect", False)
             _, func_kwargs = validate_and_group_input_args(args, inputs_state_indices)
             func_kwargs = dict(list(func_kwargs.items())[3:])
-            varibales = {**query_parameters, **func_kwargs, **states_}
-            if prop == "pathname":
-                try:
-                    response = await self.resolve_url(
-                        pathname_, varibales, loading_state_
+            response = await self.resolve_navigation(
+                prop, pathname_, search_, loading_state_, {**func_kwargs, **states_}
+            )
+            return _json_response(response, self.typed_array_threshold) if response else response
+
+        if self.resolve_endpoint:
+            @self.app.server.post(self.app.config.routes_pathname_prefix + RESOLVE_ROUTE)
+            async def resolve_endpoint():
+                body = await request.get_json(force=True)
+                if self.stream_responses:
+                    responses = self.stream_navigation(
+                        body.get("trigger"),
+                        body.get("pathname") or "",
+                        body.get("search") or "",
+                        body.get("state") or {},
+                        body.get("inputs") or {},
+                    )
+                    return Response(
+                        _ndjson_stream(responses, self.typed_array_threshold),
+                        mimetype="application/x-ndjson",
                     )
-                    return response.model_dump()
-                except Exception:
-                    print(f"Traceback: {traceback.format_exc()}")
-                    raise Exception("Failed to resolve the URL")
-
-            if prop == "search":
-                updated = dict(set(query_parameters.items()) - set(previous_qp.items()))
-                missing_keys = previous_qp.keys() - query_parameters.keys()
-                missing = {
-                    key: None
-                    for key in missing_keys
-                    if key not in self.app.routing_callback_inputs
-                }
-                updates = dict(updated.items() | missing.items())
-                response = await self.resolve_search(
-                    pathname_, varibales, updates, loading_state_
+
+                response = await self.resolve_navigation(
+                    body.get("trigger"),
+                    body.get("pathname") or "",
+                    body.get("search") or "",
+                    body.get("state") or {},
+                    body.get("inputs") or {},
+                )
+                return _json_response(
+                    response or RouterResponse(multi=True, response={}),
+                    self.typed_array_threshold,
                 )
-                return response.model_dump() if response else response
 
         @self.app.server.before_serving
         async def trigger_router():
+            if self.resolve_endpoint:
+                routing_inputs = self.app.routing_callback_inputs
+                clientside_callback(
+                    resolve_handler(
+                        self.app.config.requests_pathname_prefix + RESOLVE_ROUTE,
+                        list(routing_inputs.keys()),
+                        stream=self.stream_responses,
+                    ),
+                    Output(RootContainer.ids.dummy, "id"),
+                    Input(RootContainer.ids.location, "pathname"),
+                    Input(RootContainer.ids.location, "search"),
+                    State(RootContainer.ids.state_store, "data"),
+                    *routing_inputs.values(),
+                )
+                return
+
             inputs = dict(
                 pathname_=Input(RootContainer.ids.location, "pathname"),
                 search_=Input(RootContainer.ids.location, "search"),
@@ -637,35 +1087,6 @@ class Router:
         async def load_lacy_component(
             lacy_segment_id, variables, pathname, search, loading_state
         ):
-            node_id = lacy_segment_id.get("index")
-            qs = _parse_query_string(search)
-            query_parameters = loading_state.pop("query_params", {})
-            _ = loading_state.pop("is_redirect", False)
-            node_variables = json.loads(variables)
-            variables = {**qs, **query_parameters, **node_variables}
-            lacy_node = RouteRegistry.get_node(node_id)
-            path = self.strip_relative_path(pathname)
-            segments = path.split("/")
-            node_segments = lacy_node.module.split(".")[:-1]
-            current_index = node_segments.index(
-                lacy_node.segment_value.replace("_", "-")
-            )
-            remaining_segments = list(reversed(segments[current_index:]))
-
-            ctx = RoutingContext.from_request(
-                pathname=pathname,
-                query_params=variables,
-                loading_state_dict=loading_state,
-                resolve_type="lacy",
+            return await self.resolve_lacy(
+                lacy_segment_id.get("index"), variables, pathname, search, loading_state
             )
-
-            ctx.segments = remaining_segments
-
-            exec_tree = self.build_execution_tree(
-                current_node=lacy_node,
-                ctx=ctx,
-            )
-
-            endpoint_results = await ctx.gather_endpoints()
-            layout = await exec_tree.execute(endpoint_results)
-            return layout
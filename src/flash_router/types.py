@@ -11,6 +11,7 @@ QueryParams = dict[str, JSONType]
 PathVariables = dict[str, BaseType | Sequence[BaseType]]
 ResolveType = Literal["search", "url", "lacy"]
 StateType = Literal["lacy", "done", "hidden"]
+ExecutionMode = Literal["inline", "thread", "process"]
 EndpointResult = BaseModel | Exception | BaseException
 EndpointResults = dict[str, EndpointResult]
 Endpoint = Callable[..., Awaitable[EndpointResult]]
@@ -1,2 +1,3 @@
 REST_TOKEN = "__rest"
 DEFAULT_LAYOUT_TOKEN = "[default]"
+ROUTE_FILES = ("page.py", "default.py", "loading.py", "error.py", "api.py")
@@ -1,14 +1,15 @@
-from collections.abc import Sequence
 from ..types import Layout, QueryParams, PathVariables, BaseType, ErrorLayout
+from .serialization import to_json_compatible
 from dash.development.base_component import Component, ComponentType
 from pydantic import BaseModel
+from collections.abc import Awaitable
+from typing import Any
+import asyncio
 import inspect
 
 
 from _plotly_utils.optional_imports import get_module
 from plotly.io._json import clean_to_json_compatible, config, JsonConfig
-from fnmatch import fnmatch
-import re
 import os
 
 
@@ -29,9 +30,29 @@ async def _invoke_layout(
     raise RuntimeError(f"Error invoking layout for func: {func.__name__}")
 
 
+async def gather_limited(
+    *aws: Awaitable[Any],
+    limit: int | None = None,
+    return_exceptions: bool = False,
+) -> list[Any]:
+    """asyncio.gather with an optional upper bound of concurrently running awaitables"""
+    if not limit:
+        return await asyncio.gather(*aws, return_exceptions=return_exceptions)
+
+    semaphore = asyncio.Semaphore(limit)
+
+    async def run(aw: Awaitable[Any]):
+        async with semaphore:
+            return await aw
+
+    return await asyncio.gather(
+        *[run(aw) for aw in aws], return_exceptions=return_exceptions
+    )
+
+
 def recursive_to_plotly_json(component: ComponentType):
     """
-    Recursively convert a component to a JSON-serializable structure.
+    Convert a component to a JSON-serializable structure.
     Handles Plotly components, numpy arrays, pandas objects, dates/times, and other special types.
 
     Parameters:
@@ -43,94 +64,7 @@ def recursive_to_plotly_json(component: ComponentType):
     --------
     A JSON-serializable representation of the component
     """
-    # Base case: simple types don't need conversion
-    if component is None or isinstance(component, (str, int, float, bool)):
-        return component
-
-    # Try to handle numpy arrays first
-    try:
-        import numpy as np
-
-        if isinstance(component, np.ndarray):
-            return component.tolist()
-        elif np.isscalar(component) and not isinstance(
-            component, (bool, int, float, complex)
-        ):
-            return component.item()
-    except (ImportError, AttributeError):
-        pass
-
-    # Handle pandas objects
-    try:
-        import pandas as pd
-
-        if isinstance(component, (pd.Series, pd.DataFrame)):
-            return component.to_dict()
-        elif isinstance(component, pd.Timestamp):
-            return component.isoformat()
-        elif component is pd.NaT:
-            return None
-    except (ImportError, AttributeError):
-        pass
-
-    # Handle datetime objects
-    try:
-        import datetime
-
-        if isinstance(component, (datetime.date, datetime.datetime)):
-            return component.isoformat()
-    except (ImportError, AttributeError):
-        pass
-
-    # Handle decimal
-    try:
-        import decimal
-
-        if isinstance(component, decimal.Decimal):
-            return float(component)
-    except (ImportError, AttributeError):
-        pass
-
-    # Convert component to plotly json if it has the method
-    if hasattr(component, "to_plotly_json"):
-        component = component.to_plotly_json()
-
-    # Also try other common serialization methods
-    if hasattr(component, "tolist"):
-        try:
-            return component.tolist()
-        except Exception:
-            pass
-
-    if hasattr(component, "to_dict"):
-        try:
-            return component.to_dict()
-        except Exception:
-            pass
-
-    # Make sure component is a dictionary before checking for "props"
-    if isinstance(component, dict):
-        # Process props
-        for key, value in list(component.items()):
-            if isinstance(value, list):
-                # Process lists of items
-                component[key] = [recursive_to_plotly_json(item) for item in value]
-            else:
-                # Process single items
-                component[key] = recursive_to_plotly_json(value)
-
-    # Handle list-type components
-    elif isinstance(component, list):
-        component = [recursive_to_plotly_json(item) for item in component]
-
-    # As a last resort, try string representation
-    else:
-        try:
-            return str(component)
-        except Exception:
-            return None
-
-    return component
+    return to_json_compatible(component)
 
 
 def format_relative_path(path: str):
@@ -237,29 +171,3 @@ def to_json_plotly(plotly_object, pretty=False, engine=None):
         )
         return cleaned
 
-
-def _parse_path_variables(pathname: str, path_template: str) -> PathVariables:
-    """
-    creates the dict of path variables passed to the layout
-    e.g. path_template= "/asset/<asset_id>"
-         if pathname provided by the browser is "/assets/a100"
-         returns **{"asset_id": "a100"}
-    """
-
-    # parse variable definitions e.g. <var_name> from template
-    # and create pattern to match
-    wildcard_pattern = re.sub("[.*?]", "*", path_template)
-    var_pattern = re.sub("[.*?]", "(.*)", path_template)
-
-    # check that static sections of the pathname match the template
-    if not fnmatch(pathname, wildcard_pattern):
-        return {}
-
-    # parse variable names e.g. var_name from template
-    var_names = re.findall("[(.*?)]", path_template)
-
-    # parse variables from path
-    variables = re.findall(var_pattern, pathname)
-    variables: Sequence[BaseType] = variables[0] if isinstance(variables[0], tuple) else variables
-
-    return dict(zip(var_names, variables))
@@ -0,0 +1,261 @@
+from __future__ import annotations
+
+from collections.abc import Callable
+from functools import lru_cache
+from typing import Any
+import dataclasses
+import datetime
+import decimal
+import enum
+import json
+import sys
+
+from _plotly_utils.optional_imports import get_module
+from _plotly_utils.utils import is_skipped_key, to_typed_array_spec
+
+
+orjson = get_module("orjson", should_load=True)
+
+if orjson is not None and hasattr(orjson, "Fragment"):
+    Fragment = orjson.Fragment
+
+    def _decode_fragment(fragment: Any) -> Any:
+        return orjson.loads(orjson.dumps(fragment))
+
+else:
+
+    class Fragment:
+        """Already serialized JSON, the pure Python encoder decodes it again"""
+
+        __slots__ = ("contents",)
+
+        def __init__(self, contents: bytes | str) -> None:
+            self.contents = contents
+
+    def _decode_fragment(fragment: Any) -> Any:
+        return json.loads(fragment.contents)
+
+Encoder = Callable[[Any], Any]
+
+_NATIVE_TYPES = frozenset({str, int, float, bool, type(None)})
+# Resolved encoder per concrete type, filled on first sight of a type
+_ENCODERS: dict[type, Encoder] = {}
+
+
+def _to_str(obj: Any) -> str | None:
+    try:
+        return str(obj)
+    except Exception:
+        return None
+
+
+def _try_method(name: str) -> Encoder:
+    def encode(obj: Any) -> Any:
+        try:
+            return getattr(obj, name)()
+        except Exception:
+            return _to_str(obj)
+
+    return encode
+
+
+def _dataclass_fields(obj: Any) -> dict[str, Any]:
+    return {field.name: getattr(obj, field.name) for field in dataclasses.fields(obj)}
+
+
+def _resolve_encoder(cls: type) -> Encoder:
+    """
+    Find the encoder of a type, checks run in the order of the former
+    recursive_to_plotly_json so every supported type keeps its output.
+    """
+    # Subclasses of JSON types (e.g. enums, numpy.float64) are emitted as their base type
+    for base in (bool, int, float):
+        if issubclass(cls, base):
+            return base
+    if issubclass(cls, str):
+        return str.__str__
+    if issubclass(cls, Fragment):
+        return _decode_fragment
+    # Encoded natively by orjson, both encoders have to agree
+    if issubclass(cls, enum.Enum):
+        return lambda obj: obj.value
+    if dataclasses.is_dataclass(cls):
+        return _dataclass_fields
+
+    np = sys.modules.get("numpy")
+    if np is not None:
+        if issubclass(cls, np.ndarray):
+            return np.ndarray.tolist
+        if issubclass(cls, np.generic) and not issubclass(cls, (bool, int, float, complex)):
+            return np.generic.item
+
+    pd = sys.modules.get("pandas")
+    if pd is not None:
+        if issubclass(cls, (pd.Series, pd.DataFrame)):
+            return _try_method("to_dict")
+        if issubclass(cls, pd.Timestamp):
+            return pd.Timestamp.isoformat
+        if cls is type(pd.NaT):
+            return lambda obj: None
+
+    if issubclass(cls, (datetime.date, datetime.datetime)):
+        return cls.isoformat
+    if issubclass(cls, decimal.Decimal):
+        return float
+    if hasattr(cls, "to_plotly_json"):
+        return lambda obj: obj.to_plotly_json()
+    if hasattr(cls, "tolist"):
+        return _try_method("tolist")
+    if hasattr(cls, "to_dict"):
+        return _try_method("to_dict")
+
+    if issubclass(cls, dict):
+        return dict
+    if issubclass(cls, (list, tuple)):
+        return list
+
+    return _to_str
+
+
+def encode_default(obj: Any) -> Any:
+    """Convert a single non-JSON value one level, nested values are encoded by the caller"""
+    cls = type(obj)
+    encoder = _ENCODERS.get(cls)
+    if encoder is None:
+        encoder = _ENCODERS[cls] = _resolve_encoder(cls)
+    return encoder(obj)
+
+
+# --- Typed arrays ---
+
+
+def _is_graph(cls: type) -> bool:
+    return (
+        getattr(cls, "_namespace", None) == "dash_core_components"
+        and getattr(cls, "_type", None) == "Graph"
+    )
+
+
+def _to_typed_array(value: Any, threshold: int) -> Any:
+    np = sys.modules.get("numpy")
+    if np is None:
+        return value
+
+    pd = sys.modules.get("pandas")
+    if pd is not None and isinstance(value, (pd.Series, pd.Index)):
+        array = value.to_numpy()
+    elif isinstance(value, np.ndarray):
+        array = value
+    else:
+        return value
+
+    if array.dtype.kind not in "iuf" or array.size < threshold:
+        return value
+
+    spec = to_typed_array_spec(array)
+    # int64 values beyond the int32 range have no plotly.js typed array
+    return spec if isinstance(spec, dict) else value
+
+
+def _encode_arrays(obj: Any, threshold: int) -> Any:
+    if isinstance(obj, dict):
+        return {
+            key: value if is_skipped_key(key) else _encode_arrays(value, threshold)
+            for key, value in obj.items()
+        }
+    if isinstance(obj, (list, tuple)):
+        return [_encode_arrays(item, threshold) for item in obj]
+    return _to_typed_array(obj, threshold)
+
+
+def encode_figure(figure: Any, threshold: int) -> Any:
+    """
+    Replace numeric numpy arrays and pandas columns of the figure traces with
+    plotly.js typed array specs (``{"dtype", "bdata"}``) once they reach
+    ``threshold`` elements. Layout values are left untouched.
+    """
+    if hasattr(figure, "to_plotly_json"):
+        figure = figure.to_plotly_json()
+    if not isinstance(figure, dict):
+        return figure
+
+    encoded = dict(figure)
+    if isinstance(figure.get("data"), (list, tuple)):
+        encoded["data"] = [_encode_arrays(trace, threshold) for trace in figure["data"]]
+    if isinstance(figure.get("frames"), (list, tuple)):
+        encoded["frames"] = [
+            {**frame, "data": _encode_arrays(frame.get("data", []), threshold)}
+            if isinstance(frame, dict)
+            else frame
+            for frame in figure["frames"]
+        ]
+    return encoded
+
+
+@lru_cache(maxsize=8)
+def _typed_array_default(threshold: int) -> Encoder:
+    def encode(obj: Any) -> Any:
+        if _is_graph(type(obj)):
+            component = obj.to_plotly_json()
+            if component["props"].get("figure") is not None:
+                component["props"]["figure"] = encode_figure(component["props"]["figure"], threshold)
+            return component
+        return encode_default(obj)
+
+    return encode
+
+
+def to_json_compatible(obj: Any, default: Encoder = encode_default) -> Any:
+    """Single pass conversion of a component tree into plain JSON types, input is not mutated"""
+    cls = type(obj)
+    if cls in _NATIVE_TYPES:
+        return obj
+    if cls is dict:
+        return {key: to_json_compatible(value, default) for key, value in obj.items()}
+    if cls is list or cls is tuple:
+        return [to_json_compatible(item, default) for item in obj]
+    return to_json_compatible(default(obj), default)
+
+
+def _dumps_json(obj: Any, default: Encoder) -> bytes:
+    return json.dumps(to_json_compatible(obj, default), separators=(",", ":")).encode("utf-8")
+
+
+if orjson is not None:
+    _ORJSON_OPTIONS = (
+        orjson.OPT_NON_STR_KEYS
+        | orjson.OPT_PASSTHROUGH_DATETIME
+        | orjson.OPT_PASSTHROUGH_SUBCLASS
+    )
+
+    def dumps(obj: Any, typed_array_threshold: int | None = None) -> bytes:
+        """
+        Encode a component tree to JSON bytes in one pass. Figure arrays of at
+        least ``typed_array_threshold`` elements are sent as typed arrays.
+        """
+        default = (
+            encode_default
+            if typed_array_threshold is None
+            else _typed_array_default(typed_array_threshold)
+        )
+        try:
+            return orjson.dumps(obj, default=default, option=_ORJSON_OPTIONS)
+        except orjson.JSONEncodeError as error:
+            # orjson stops at a fixed nesting depth (about 85 components)
+            if "Recursion limit" not in str(error):
+                raise
+            return _dumps_json(obj, default)
+
+else:
+
+    def dumps(obj: Any, typed_array_threshold: int | None = None) -> bytes:
+        """
+        Encode a component tree to JSON bytes in one pass. Figure arrays of at
+        least ``typed_array_threshold`` elements are sent as typed arrays.
+        """
+        default = (
+            encode_default
+            if typed_array_threshold is None
+            else _typed_array_default(typed_array_threshold)
+        )
+        return _dumps_json(obj, default)
@@ -6,4 +6,4 @@ TESTS_DIR = Path(__file__).resolve().parents[1]
 if str(TESTS_DIR) not in sys.path:
     sys.path.insert(0, str(TESTS_DIR))
 
-from utils.helpers import reset_route_state, router
+from utils.helpers import isolated_working_directory, reset_route_state, router
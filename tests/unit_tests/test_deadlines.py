@@ -0,0 +1,51 @@
+import asyncio
+import json
+
+from pydantic import BaseModel
+
+from flash_router import remaining_time
+from flash_router.core.routing import RouteRegistry, _bind
+
+
+class Ticket(BaseModel):
+    ticket_id: str
+
+
+def render(router, pathname):
+    response = asyncio.run(router.resolve_url(pathname, {}, {}))
+    return json.dumps(json.loads(response.to_json()))
+
+
+def test_slow_endpoint_renders_the_error_layout(router):
+    async def slow_endpoint(**kwargs):
+        await asyncio.sleep(1)
+        return Ticket(ticket_id="late")
+
+    _bind(
+        RouteRegistry.get_node("tickets/[ticket-id]/(detail)"),
+        endpoint=slow_endpoint,
+        endpoint_timeout=0.01,
+    )
+
+    body = render(router, "/tickets/1001")
+
+    assert "did not finish in time" in body
+    assert "Ticket 1001" in body
+
+
+def test_request_deadline_is_exposed_to_endpoints(router):
+    budgets = []
+
+    async def endpoint(**kwargs):
+        budgets.append(remaining_time())
+        return Ticket(ticket_id="1001")
+
+    _bind(RouteRegistry.get_node("tickets/[ticket-id]"), endpoint=endpoint, endpoint_timeout=5)
+    _bind(RouteRegistry.get_node("tickets/[ticket-id]/(detail)"), endpoint=endpoint)
+    router.request_timeout = 2
+
+    render(router, "/tickets/1001")
+
+    assert len(budgets) == 2
+    assert all(0 < budget <= 2 for budget in budgets)
+    assert remaining_time() is None
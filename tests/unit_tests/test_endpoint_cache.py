@@ -0,0 +1,200 @@
+import asyncio
+import json
+import re
+
+from dash import html
+from pydantic import BaseModel
+
+from flash_router import EndpointCacheConfig, RootContainer
+from flash_router.core.endpoints import EndpointCache, single_flight
+from flash_router.core.routing import RouteRegistry, _bind
+
+
+class Ticket(BaseModel):
+    ticket_id: str
+    version: int
+
+
+def counting_endpoint(calls):
+    async def endpoint(ticket_id: str, **kwargs):
+        calls.append(ticket_id)
+        return Ticket(ticket_id=ticket_id, version=len(calls))
+
+    return endpoint
+
+
+def test_endpoint_results_are_cached_by_inputs(router):
+    calls = []
+    _bind(
+        RouteRegistry.get_node("tickets/[ticket-id]"),
+        endpoint=counting_endpoint(calls),
+        endpoint_cache=EndpointCacheConfig(ttl=60),
+    )
+
+    for pathname, search in [("/tickets/1001", {}), ("/tickets/1001", {"unused": "1"}), ("/tickets/1002", {})]:
+        asyncio.run(router.resolve_url(pathname, search, {}))
+
+    assert calls == ["1001", "1002"]
+    assert router.endpoint_cache.info().hits == 1
+
+
+def test_stale_result_is_served_while_revalidating(monkeypatch):
+    cache = EndpointCache()
+    config = EndpointCacheConfig(ttl=10, stale_while_revalidate=30)
+    clock = [100.0]
+    monkeypatch.setattr("flash_router.core.endpoints.time.monotonic", lambda: clock[0])
+    calls = []
+    endpoint = counting_endpoint(calls)
+
+    async def scenario():
+        first = await cache.call("key", config, lambda: endpoint("1"))
+        clock[0] += 15
+        stale = await cache.call("key", config, lambda: endpoint("1"))
+        await asyncio.sleep(0)
+        fresh = await cache.call("key", config, lambda: endpoint("1"))
+        clock[0] += 60
+        expired = await cache.call("key", config, lambda: endpoint("1"))
+        return first, stale, fresh, expired
+
+    first, stale, fresh, expired = asyncio.run(scenario())
+
+    assert first.version == stale.version == 1
+    assert fresh.version == 2
+    assert expired.version == 3
+    assert cache.info().stale_hits == 1
+
+
+def test_cache_is_bounded_by_result_size():
+    cache = EndpointCache(maxbytes=100)
+    ticket = Ticket(ticket_id="1", version=1)
+    size = len(ticket.model_dump_json())
+
+    for index in range(100 // size + 1):
+        cache.store(str(index), ticket)
+    cache.store("error", ValueError("not cached"))
+
+    assert cache.info().nbytes <= 100
+    assert cache.info().currsize == 100 // size
+    assert "error" not in cache._results
+
+
+def test_session_results_require_a_session(router):
+    calls = []
+    _bind(
+        RouteRegistry.get_node("tickets/[ticket-id]"),
+        endpoint=counting_endpoint(calls),
+        endpoint_cache=EndpointCacheConfig(ttl=60, vary_by_session=True),
+    )
+
+    asyncio.run(router.resolve_url("/tickets/1001", {}, {}))
+    asyncio.run(router.resolve_url("/tickets/1001", {}, {}))
+    router.endpoint_cache.session_id = lambda: "session-a"
+    asyncio.run(router.resolve_url("/tickets/1001", {}, {}))
+    asyncio.run(router.resolve_url("/tickets/1001", {}, {}))
+
+    assert calls == ["1001", "1001", "1001"]
+
+
+def test_concurrent_identical_calls_are_coalesced(router):
+    calls = []
+
+    async def endpoint(ticket_id: str, **kwargs):
+        calls.append(ticket_id)
+        await asyncio.sleep(0.01)
+        return Ticket(ticket_id=ticket_id, version=len(calls))
+
+    _bind(RouteRegistry.get_node("tickets/[ticket-id]"), endpoint=endpoint)
+    router.coalesce_endpoints = True
+    single_flight.reset()
+
+    async def navigate():
+        return await asyncio.gather(
+            router.resolve_url("/tickets/1001", {}, {}),
+            router.resolve_url("/tickets/1001", {}, {}),
+            router.resolve_url("/tickets/1002", {}, {}),
+        )
+
+    asyncio.run(navigate())
+
+    assert sorted(calls) == ["1001", "1002"]
+    assert single_flight.info() == (2, 1, 0)
+
+
+def test_search_keys_every_tree_by_its_inputs(router, monkeypatch):
+    calls = []
+
+    def query_endpoint(node_id):
+        async def endpoint(q: str = None, **kwargs):
+            calls.append((node_id, q))
+            return q
+
+        return endpoint
+
+    node_ids = ["nested-route", "nested-route/child-1"]
+    for node_id in node_ids:
+        _bind(
+            RouteRegistry.get_node(node_id),
+            endpoint=query_endpoint(node_id),
+            endpoint_cache=EndpointCacheConfig(ttl=60),
+        )
+    consumers = [RouteRegistry.get_node(node_id) for node_id in node_ids]
+    monkeypatch.setattr(RouteRegistry, "get_input_consumers", lambda inputs: consumers)
+
+    response = asyncio.run(router.resolve_url("/nested-route/child-1", {"q": "1"}, {}))
+    loading_state = response.response[RootContainer.ids.state_store]["data"]
+    mounted = {
+        key: state for key, state in loading_state.items() if key not in ("query_params", "is_redirect")
+    }
+    for q in ["2", "3"]:
+        asyncio.run(router.resolve_search("/nested-route/child-1", {"q": q}, {"q": q}, dict(mounted)))
+
+    assert sorted(calls) == [(node_id, q) for node_id in node_ids for q in ["1", "2", "3"]]
+
+
+def test_concurrent_searches_with_different_inputs_are_not_coalesced(router, monkeypatch):
+    async def endpoint(q: str = None, **kwargs):
+        await asyncio.sleep(0.01)
+        return f"result-{q}"
+
+    async def layout(data=None, **kwargs):
+        return html.Div(data)
+
+    node_ids = ["nested-route", "nested-route/child-1"]
+    for node_id in node_ids:
+        _bind(RouteRegistry.get_node(node_id), endpoint=endpoint, layout=layout)
+    consumers = [RouteRegistry.get_node(node_id) for node_id in node_ids]
+    monkeypatch.setattr(RouteRegistry, "get_input_consumers", lambda inputs: consumers)
+    router.coalesce_endpoints = True
+    single_flight.reset()
+
+    response = asyncio.run(router.resolve_url("/nested-route/child-1", {}, {}))
+    loading_state = response.response[RootContainer.ids.state_store]["data"]
+    mounted = {
+        key: state for key, state in loading_state.items() if key not in ("query_params", "is_redirect")
+    }
+
+    async def search():
+        return await asyncio.gather(*[
+            router.resolve_search("/nested-route/child-1", {"q": q}, {"q": q}, dict(mounted))
+            for q in ["1", "2", "3"]
+        ])
+
+    responses = [json.loads(response.to_json()) for response in asyncio.run(search())]
+
+    for q, response in zip(["1", "2", "3"], responses):
+        rendered = json.dumps([update.get("children") for update in response["response"].values()])
+        assert set(re.findall(r"result-\d", rendered)) == {f"result-{q}"}
+    assert single_flight.info().coalesced == 0
+
+
+def test_nested_results_are_counted_in_full():
+    cache = EndpointCache(maxbytes=1_000_000)
+    rows = {"rows": [{"id": index, "name": f"row-{index}"} for index in range(10_000)]}
+
+    for index in range(10):
+        cache.store(str(index), rows)
+    cache.store("columns", [list(range(10_000))] * 100)
+
+    assert cache.info().nbytes <= 1_000_000
+    assert cache.info().currsize < 10
+    assert "columns" not in cache._results
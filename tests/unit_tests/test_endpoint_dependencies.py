@@ -0,0 +1,83 @@
+import asyncio
+import json
+import time
+
+import pytest
+from pydantic import BaseModel
+
+from flash_router.core.routing import RouteRegistry, _bind
+
+
+class Ticket(BaseModel):
+    ticket_id: str
+
+
+def render(router, pathname):
+    response = asyncio.run(router.resolve_url(pathname, {}, {}))
+    return json.dumps(json.loads(response.to_json()))
+
+
+def test_dependent_endpoint_receives_the_ancestor_result(router):
+    events = []
+
+    async def ticket_endpoint(ticket_id: str, **kwargs):
+        events.append(("ticket-start", time.perf_counter()))
+        await asyncio.sleep(0.02)
+        events.append(("ticket-done", time.perf_counter()))
+        return Ticket(ticket_id=ticket_id)
+
+    async def detail_endpoint(ticket: Ticket, **kwargs):
+        events.append(("detail-start", ticket.ticket_id))
+        return ticket
+
+    async def activity_endpoint(**kwargs):
+        events.append(("activity-start", time.perf_counter()))
+        return None
+
+    _bind(RouteRegistry.get_node("tickets/[ticket-id]"), endpoint=ticket_endpoint)
+    _bind(
+        RouteRegistry.get_node("tickets/[ticket-id]/(detail)"),
+        endpoint=detail_endpoint,
+        endpoint_depends={"ticket": "tickets/[ticket-id]"},
+    )
+    _bind(RouteRegistry.get_node("tickets/[ticket-id]/(activity)"), endpoint=activity_endpoint)
+
+    render(router, "/tickets/1001")
+    order = [name for name, _ in events]
+
+    assert ("detail-start", "1001") in events
+    assert order.index("detail-start") > order.index("ticket-done")
+    assert order.index("activity-start") < order.index("ticket-done")
+
+
+def test_failed_dependency_renders_the_error_layout(router):
+    async def ticket_endpoint(**kwargs):
+        raise LookupError("ticket not found")
+
+    async def detail_endpoint(ticket: Ticket, **kwargs):
+        return ticket
+
+    _bind(RouteRegistry.get_node("tickets/[ticket-id]"), endpoint=ticket_endpoint)
+    _bind(
+        RouteRegistry.get_node("tickets/[ticket-id]/(detail)"),
+        endpoint=detail_endpoint,
+        endpoint_depends={"ticket": "tickets/[ticket-id]"},
+    )
+
+    body = render(router, "/tickets/1001")
+
+    assert "ticket not found" in body
+
+
+def test_dependency_has_to_be_an_ancestor(router):
+    async def detail_endpoint(ticket: Ticket, **kwargs):
+        return ticket
+
+    _bind(
+        RouteRegistry.get_node("tickets/[ticket-id]/(detail)"),
+        endpoint=detail_endpoint,
+        endpoint_depends={"ticket": "tickets/[ticket-id]/(activity)"},
+    )
+
+    with pytest.raises(ValueError, match="no ancestor"):
+        render(router, "/tickets/1001")
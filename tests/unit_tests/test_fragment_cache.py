@@ -0,0 +1,98 @@
+import asyncio
+import json
+
+from flash_router import FragmentCacheConfig, RootContainer
+from flash_router.core.fragments import FragmentCache
+from flash_router.core.routing import RouteRegistry, _bind
+from flash_router.utils.serialization import Fragment
+from dash import html
+
+
+def cache_route(node_id, config):
+    _bind(RouteRegistry.get_node(node_id), fragment_cache=config)
+
+
+def render(router, pathname, query_parameters=None):
+    response = asyncio.run(router.resolve_url(pathname, query_parameters or {}, {}))
+    return json.loads(response.to_json())
+
+
+def test_cached_slot_is_spliced_into_the_response(router):
+    cache_route("nested-route/(slot-1)", FragmentCacheConfig())
+
+    first = render(router, "/nested-route/child-1")
+    second = render(router, "/nested-route/child-1")
+
+    assert router.fragment_cache.info().hits == 1
+    assert router.fragment_cache.info().currsize == 1
+    assert first == second
+
+
+def test_vary_by_separates_entries(router):
+    cache_route("nested-route/(slot-1)", FragmentCacheConfig(vary_by=["team"]))
+
+    render(router, "/nested-route", {"team": "a"})
+    render(router, "/nested-route", {"team": "b"})
+    render(router, "/nested-route", {"team": "a", "unrelated": "1"})
+
+    assert router.fragment_cache.info().currsize == 2
+    assert router.fragment_cache.info().hits == 1
+
+
+def test_expired_and_evicted_fragments_are_dropped(monkeypatch):
+    cache = FragmentCache(maxsize=2)
+    clock = [100.0]
+    monkeypatch.setattr("flash_router.core.fragments.time.monotonic", lambda: clock[0])
+
+    fragment = cache.put("short", html.Div("short"), ttl=5)
+    cache.put("first", html.Div("first"), ttl=None)
+    cache.put("second", html.Div("second"), ttl=None)
+
+    assert isinstance(fragment, Fragment)
+    assert cache.get("short") is None
+    assert cache.get("first") is not None
+
+    clock[0] += 10
+    cache.put("third", html.Div("third"), ttl=1)
+    clock[0] += 1
+
+    assert cache.get("second") is None
+    assert cache.get("third") is None
+    assert cache.get("first") is not None
+
+
+def test_cached_lacy_layout_is_returned_as_plain_json(router):
+    cache_route("nested-route/child-3/(slot-31)", FragmentCacheConfig())
+    response = render(router, "/nested-route/child-3")
+    loading_state = response["response"][RootContainer.ids.state_store]["data"]
+
+    layouts = [
+        asyncio.run(router.resolve_lacy(
+            "nested-route/child-3/(slot-31)", "{}", "/nested-route/child-3", "", dict(loading_state)
+        ))
+        for _ in range(2)
+    ]
+
+    assert router.fragment_cache.info().hits == 1
+    # Lacy layouts go through the callback serializer of Dash
+    assert json.dumps(layouts[0]) == json.dumps(layouts[1])
+
+
+def test_path_values_below_the_cached_node_separate_entries(router):
+    cache_route("files", FragmentCacheConfig())
+
+    for pathname in ["/files/x/y", "/files/x/z", "/files/x/y"]:
+        render(router, pathname)
+
+    assert router.fragment_cache.info().currsize == 2
+    assert router.fragment_cache.info().hits == 1
+
+
+def test_vary_by_reads_path_values_below_the_cached_node(router):
+    cache_route("files", FragmentCacheConfig(vary_by=["rest"]))
+
+    for pathname in ["/files/docs/intro", "/files/docs/setup"]:
+        render(router, pathname)
+
+    assert router.fragment_cache.info().currsize == 2
+    assert router.fragment_cache.info().hits == 0
@@ -0,0 +1,76 @@
+import asyncio
+import json
+
+from dash import html
+
+from flash_router import RootContainer, SlotContainer
+from flash_router.core.execution import ExecNode
+from flash_router.core.routing import RouteRegistry, _bind
+from flash_router.utils.helper_functions import gather_limited
+
+
+def test_gather_limited_bounds_concurrency():
+    running = 0
+    peak = 0
+
+    async def render(value):
+        nonlocal running, peak
+        running += 1
+        peak = max(peak, running)
+        await asyncio.sleep(0.01)
+        running -= 1
+        return value
+
+    results = asyncio.run(gather_limited(*[render(i) for i in range(6)], limit=2))
+
+    assert results == list(range(6))
+    assert peak == 2
+
+
+def test_gather_limited_isolates_errors():
+    async def ok():
+        return "ok"
+
+    async def fail():
+        raise ValueError("broken tree")
+
+    results = asyncio.run(gather_limited(ok(), fail(), ok(), return_exceptions=True))
+
+    assert results[0] == results[2] == "ok"
+    assert isinstance(results[1], ValueError)
+
+
+def test_failing_search_tree_renders_its_error_layout(router, monkeypatch):
+    async def layout(**kwargs):
+        return html.Div("rendered")
+
+    async def error_layout(error, **kwargs):
+        return html.Div(f"error: {error}")
+
+    node_ids = ["nested-route/(slot-1)", "nested-route/(slot-2)"]
+    for node_id in node_ids:
+        _bind(RouteRegistry.get_node(node_id), layout=layout, error=error_layout)
+    consumers = [RouteRegistry.get_node(node_id) for node_id in node_ids]
+    monkeypatch.setattr(RouteRegistry, "get_input_consumers", lambda inputs: consumers)
+
+    execute = ExecNode.execute
+
+    async def failing_execute(self, endpoint_results):
+        if self.node_id == node_ids[0]:
+            raise ValueError("broken tree")
+        return await execute(self, endpoint_results)
+
+    response = asyncio.run(router.resolve_url("/nested-route/child-1", {}, {}))
+    loading_state = response.response[RootContainer.ids.state_store]["data"]
+    mounted = {
+        key: state for key, state in loading_state.items() if key not in ("query_params", "is_redirect")
+    }
+    monkeypatch.setattr(ExecNode, "execute", failing_execute)
+
+    response = asyncio.run(router.resolve_search("/nested-route/child-1", {"q": "1"}, {"q": "1"}, mounted))
+    rendered = json.loads(response.to_json())["response"]
+
+    failed = rendered[json.dumps(SlotContainer.ids.container("nested-route", "slot_1"))]
+    assert failed["children"]["props"]["children"] == "error: broken tree"
+    sibling = rendered[json.dumps(SlotContainer.ids.container("nested-route", "slot_2"))]
+    assert sibling["children"]["props"]["children"] == "rendered"
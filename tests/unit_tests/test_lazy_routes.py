@@ -0,0 +1,92 @@
+import asyncio
+from pathlib import Path
+
+from flash_router import FlashRouter, RootContainer
+from flash_router.core.modules import read_static_config
+from flash_router.core.routing import RouteRegistry, RoutingContext
+
+from utils.helpers import get_leaf_node
+
+
+def lazy_router(router, **kwargs):
+    RouteRegistry.reset()
+    return FlashRouter(router.app, lazy_imports=True, **kwargs)
+
+
+def test_static_config_is_read_without_import(tmp_path):
+    page = tmp_path / "page.py"
+    page.write_text(
+        "raise RuntimeError('must not be imported')\n"
+        "config = RouteConfig(default_child='overview', is_static=False, loading=Loading)\n"
+    )
+    assert read_static_config(str(page)) == {"default_child": "overview", "is_static": False}
+
+    page.write_text("config = RouteConfig(default_child=pick_child())\n")
+    assert read_static_config(str(page)) is None
+
+    page.write_text("def layout():\n    return None\n")
+    assert read_static_config(str(page)) == {}
+
+
+def test_lazy_router_registers_same_tree(router):
+    eager_nodes = {
+        node_id: (node.parent_id, node.default_child, node.is_static, node.child_nodes, node.slots)
+        for node_id, node in RouteRegistry._nodes.items()
+    }
+
+    lazy_router(router)
+    lazy_nodes = {
+        node_id: (node.parent_id, node.default_child, node.is_static, node.child_nodes, node.slots)
+        for node_id, node in RouteRegistry._nodes.items()
+    }
+
+    assert lazy_nodes == eager_nodes
+    assert RouteRegistry.unloaded_nodes()
+
+
+def test_lazy_node_loads_on_first_resolution(router):
+    router = lazy_router(router)
+    tickets = RouteRegistry.get_node("tickets")
+    assert not tickets.is_loaded
+
+    ctx = RoutingContext.from_request(
+        pathname="/tickets/1001",
+        query_params={},
+        loading_state_dict={},
+        resolve_type="url",
+    )
+    active_node = RouteRegistry.get_active_root_node(ctx, ignore_empty_folders=False)
+    exec_tree = router.build_execution_tree(current_node=active_node, ctx=ctx)
+
+    assert tickets.is_loaded
+    assert exec_tree.layout is tickets.layout
+    assert RouteRegistry.get_node(get_leaf_node(exec_tree).node_id).is_loaded
+    assert not RouteRegistry.get_node("sales").is_loaded
+
+
+def test_prewarm_loads_all_nodes(router):
+    router = lazy_router(router)
+    router.prewarm_routes().join()
+
+    assert RouteRegistry.unloaded_nodes() == []
+    assert router._lazy_routes == {}
+
+
+def test_search_loads_mounted_nodes_before_matching_inputs(router):
+    response = asyncio.run(router.resolve_url("/projects/alpha", {}, {}))
+    loading_state = {
+        key: state
+        for key, state in response.response[RootContainer.ids.state_store]["data"].items()
+        if key not in ("query_params", "is_redirect")
+    }
+
+    router = lazy_router(router)
+    team = RouteRegistry.get_node("projects/[team-id]")
+    assert not team.is_loaded
+
+    search = asyncio.run(
+        router.resolve_search("/projects/alpha", {"team_id": "beta"}, {"team_id": "beta"}, loading_state)
+    )
+
+    assert team.is_loaded
+    assert search is not None
@@ -0,0 +1,53 @@
+from flash_router import FlashRouter
+from flash_router.core.routing import RouteRegistry
+from flash_router.navigation import generate_navigation_typing
+
+
+def test_stubs_rewritten_only_on_change(tmp_path):
+    route_ids = ["/", "projects/[team-id]", "projects/[team-id]/(files)"]
+
+    assert generate_navigation_typing(route_ids, tmp_path) is True
+    assert generate_navigation_typing(list(reversed(route_ids)), tmp_path) is False
+    assert generate_navigation_typing([*route_ids, "tickets"], tmp_path) is True
+
+    stub = tmp_path / ".flash_router_typing" / "flash_router" / "navigation.pyi"
+    assert '"tickets"' in stub.read_text(encoding="utf-8")
+
+    stub.unlink()
+    assert generate_navigation_typing([*route_ids, "tickets"], tmp_path) is True
+
+
+def test_stubs_are_generated_unless_disabled(router, tmp_path, monkeypatch):
+    monkeypatch.delenv("DASH_DEBUG", raising=False)
+    production_dir = tmp_path / "production"
+    production_dir.mkdir()
+    monkeypatch.chdir(production_dir)
+    RouteRegistry.reset()
+    production_router = FlashRouter(router.app, navigation_typing=False)
+
+    assert production_router.navigation_typing is False
+    assert not (production_dir / ".flash_router_typing").exists()
+
+    # app.run(debug=True) is called after the router is built, debug mode is unknown here
+    development_dir = tmp_path / "development"
+    development_dir.mkdir()
+    monkeypatch.chdir(development_dir)
+    RouteRegistry.reset()
+    default_router = FlashRouter(router.app, navigation_typing_background=False)
+
+    assert default_router.navigation_typing is True
+    assert (development_dir / ".flash_router_typing" / "flash_router" / "navigation.pyi").exists()
+
+
+def test_unwritable_stub_directory_is_logged(router, tmp_path, monkeypatch):
+    (tmp_path / "read-only").mkdir()
+    (tmp_path / "read-only" / ".flash_router_typing").write_text("")
+    monkeypatch.chdir(tmp_path / "read-only")
+    warnings = []
+    monkeypatch.setattr(router.app.logger, "warning", lambda message, *args: warnings.append(message % args))
+    RouteRegistry.reset()
+
+    FlashRouter(router.app, navigation_typing_background=False)
+
+    assert len(warnings) == 1
+    assert "read-only" in warnings[0]
@@ -0,0 +1,31 @@
+import gc
+
+import pytest
+
+from flash_router.core.routing import PageNode, RouteRegistry
+from flash_router.prefork import freeze_router, read_memory_usage
+
+
+def test_frozen_registry_rejects_changes(router):
+    try:
+        freeze_router(router)
+        assert gc.get_freeze_count() > 0
+
+        node = PageNode(_segment="late", node_id="late", layout=lambda: None, module="late", path="late")
+        with pytest.raises(RuntimeError):
+            RouteRegistry.add_node(node)
+        with pytest.raises(RuntimeError):
+            RouteRegistry.compile()
+
+        assert RouteRegistry.get_node("tickets") is not None
+    finally:
+        gc.unfreeze()
+
+
+def test_read_memory_usage():
+    usage = read_memory_usage()
+    if usage is None:
+        pytest.skip("/proc is not available")
+
+    assert usage.rss > 0
+    assert usage.shared + usage.private == usage.rss
@@ -0,0 +1,104 @@
+from dash import html
+
+from flash_router.core.plans import compile_plan
+from flash_router.core.routing import PageNode, RouteRegistry, RoutingContext
+
+from utils.helpers import done_state, get_node_by_path
+
+
+def resolve(router, pathname, loading_state):
+    ctx = RoutingContext.from_request(
+        pathname=pathname,
+        query_params={},
+        loading_state_dict=loading_state,
+        resolve_type="url",
+    )
+    active_node = RouteRegistry.get_active_root_node(ctx, ignore_empty_folders=False)
+    exec_tree = router.build_execution_tree(current_node=active_node, ctx=ctx)
+    return ctx, exec_tree
+
+
+def test_path_values_share_a_plan(router, monkeypatch):
+    tickets_node = get_node_by_path("tickets")
+    router.plan_cache.clear()
+    traced = []
+
+    def counting_compile(*args):
+        traced.append(args)
+        return compile_plan(*args)
+
+    monkeypatch.setattr("flash_router.core.plans.compile_plan", counting_compile)
+
+    first_ctx, first_tree = resolve(router, "/tickets/1001", dict([done_state(tickets_node, "1001")]))
+    second_ctx, second_tree = resolve(router, "/tickets/1002", dict([done_state(tickets_node, "1002")]))
+
+    assert router.plan_cache.info().misses == 1
+    assert router.plan_cache.info().hits == 1
+    # The route is only walked to compile the plan
+    assert len(traced) == 1
+    assert first_ctx.path_vars["ticket_id"] == "1001"
+    assert second_ctx.path_vars["ticket_id"] == "1002"
+    assert first_tree.segment == "[ticket_id][1001]"
+    assert second_tree.segment == "[ticket_id][1002]"
+    assert second_tree.slots["detail"].variables["ticket_id"] == "1002"
+
+
+def test_missing_path_value_uses_a_separate_plan(router):
+    router.plan_cache.clear()
+
+    resolve(router, "/tickets", {})
+    resolve(router, "/tickets/1001", {})
+
+    assert router.plan_cache.info().misses == 2
+    assert router.plan_cache.info().currsize == 2
+
+
+def test_path_value_matching_a_route_segment_uses_a_separate_plan(router):
+    router.plan_cache.clear()
+
+    resolve(router, "/tickets/1001", {})
+    ctx, exec_tree = resolve(router, "/tickets/files", {})
+
+    assert router.plan_cache.info().misses == 2
+    assert ctx.path_vars["ticket_id"] == "files"
+    assert exec_tree.child_node.segment == "[ticket_id][files]"
+
+
+def make_node(path, parent=None, **kwargs):
+    node = PageNode(
+        _segment=path.rsplit("/", 1)[-1],
+        node_id=path,
+        layout=html.Div(path),
+        module=path.replace("/", "."),
+        path=path,
+        parent_id=parent.node_id if parent else None,
+        is_root=parent is None,
+        **kwargs,
+    )
+    RouteRegistry.register_node(node, parent)
+    return node
+
+
+def test_slot_renders_its_default_child(router):
+    RouteRegistry.reset()
+    dash = make_node("dash")
+    side = make_node("dash/(side)", dash, default_child="info")
+    make_node("dash/(side)/info", side)
+
+    _, exec_tree = resolve(router, "/dash", {})
+
+    assert exec_tree.slots["side"].child_node.node_id == "dash/(side)/info"
+
+
+def test_slot_renders_its_path_template(router):
+    RouteRegistry.reset()
+    dash = make_node("dash")
+    side = make_node("dash/(side)", dash)
+    make_node("dash/(side)/[item_id]", side)
+
+    ctx, exec_tree = resolve(router, "/dash/42", {})
+    item = exec_tree.slots["side"].child_node
+
+    assert item.node_id == "dash/(side)/[item_id]"
+    assert ctx.path_vars["item_id"] == "42"
+    assert item.variables["item_id"] == "42"
@@ -0,0 +1,120 @@
+import asyncio
+import json
+
+from flash_router import FlashRouter, RootContainer
+from flash_router.client import RESOLVE_ROUTE, resolve_handler
+from flash_router.core.routing import RouteRegistry, _bind
+
+
+def post_navigation(app, payload):
+    async def post():
+        client = app.server.test_client()
+        response = await client.post("/" + RESOLVE_ROUTE, json=payload)
+        return response.status_code, await response.get_json()
+
+    return asyncio.run(post())
+
+
+def test_resolve_endpoint_renders_url(router):
+    RouteRegistry.reset()
+    FlashRouter(router.app, resolve_endpoint=True)
+
+    status, payload = post_navigation(
+        router.app,
+        {"pathname": "/tickets/1001", "search": "", "state": {}, "trigger": "pathname"},
+    )
+
+    assert status == 200
+    assert payload["multi"] is True
+    assert RootContainer.ids.container in payload["response"]
+    assert RootContainer.ids.state_store in payload["response"]
+
+
+def test_resolve_endpoint_without_search_consumers(router):
+    RouteRegistry.reset()
+    FlashRouter(router.app, resolve_endpoint=True)
+
+    status, payload = post_navigation(
+        router.app,
+        {"pathname": "/tickets", "search": "?unused=1", "state": {}, "trigger": "search"},
+    )
+
+    assert status == 200
+    assert payload["response"] == {}
+
+
+def test_resolve_handler_targets_endpoint():
+    handler = resolve_handler("/app/" + RESOLVE_ROUTE, ["language"])
+
+    assert '"/app/_flash_router/resolve"' in handler
+    assert '["language"]' in handler
+    assert "dash_clientside.set_props" in handler
+
+
+def test_stream_url_sends_parents_first(router):
+    async def collect():
+        return [
+            response
+            async for response in router.stream_url("/tickets/1001", {}, {})
+        ]
+
+    responses = asyncio.run(collect())
+    first = responses[0].response
+
+    assert all(response.multi for response in responses)
+    assert RootContainer.ids.container in first
+    assert RootContainer.ids.state_store in first
+    assert all(RootContainer.ids.state_store not in r.response for r in responses[1:])
+    assert len(responses) > 1
+
+
+def test_closed_stream_cancels_running_endpoints(router):
+    cancelled = []
+
+    async def endpoint(**kwargs):
+        try:
+            await asyncio.sleep(10)
+        except asyncio.CancelledError:
+            cancelled.append(True)
+            raise
+
+    _bind(RouteRegistry.get_node("tickets/[ticket-id]/(detail)"), endpoint=endpoint)
+
+    async def disconnect():
+        stream = router.stream_url("/tickets/1001", {}, {})
+        first = await anext(stream)
+        await stream.aclose()
+        await asyncio.sleep(0.01)
+        return first, list(cancelled)
+
+    first, cancelled_on_close = asyncio.run(asyncio.wait_for(disconnect(), 5))
+
+    assert RootContainer.ids.container in first.response
+    assert cancelled_on_close == [True]
+
+
+def test_stream_endpoint_returns_ndjson(router):
+    RouteRegistry.reset()
+    FlashRouter(router.app, stream_responses=True)
+
+    async def post():
+        client = router.app.server.test_client()
+        response = await client.post(
+            "/" + RESOLVE_ROUTE,
+            json={"pathname": "/tickets/1001", "search": "", "state": {}, "trigger": "pathname"},
+        )
+        return response.status_code, response.mimetype, await response.get_data()
+
+    status, mimetype, body = asyncio.run(post())
+    lines = [json.loads(line) for line in body.splitlines() if line]
+
+    assert status == 200
+    assert mimetype == "application/x-ndjson"
+    assert RootContainer.ids.container in lines[0]["response"]
+    assert len(lines) > 1
+
+
+def test_resolve_handler_reads_stream():
+    handler = resolve_handler("/" + RESOLVE_ROUTE, [], stream=True)
+
+    assert "getReader()" in handler
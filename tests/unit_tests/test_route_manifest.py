@@ -0,0 +1,72 @@
+import json
+import os
+
+import flash_router.router as router_module
+from flash_router import FlashRouter
+from flash_router.core.manifest import pages_fingerprint
+from flash_router.core.routing import RouteRegistry
+
+
+def registry_snapshot():
+    return {
+        node_id: (
+            node.segment_value,
+            node.parent_id,
+            node.is_static,
+            node.default_child,
+            node.child_nodes,
+            node.slots,
+            node.path_template,
+            node.endpoint_inputs,
+        )
+        for node_id, node in RouteRegistry._nodes.items()
+    }
+
+
+def fail_validation(route_table):
+    raise AssertionError("validation must be skipped on warm starts")
+
+
+def test_manifest_restores_registry(router, tmp_path, monkeypatch):
+    manifest_path = str(tmp_path / "manifest.json")
+    RouteRegistry.reset()
+    FlashRouter(router.app, manifest_path=manifest_path)
+    cold_snapshot = registry_snapshot()
+
+    with open(manifest_path, encoding="utf-8") as file:
+        manifest = json.load(file)
+    assert len(manifest["nodes"]) == len(cold_snapshot)
+
+    RouteRegistry.reset()
+    monkeypatch.setattr(router_module, "validate_tree", fail_validation)
+    FlashRouter(router.app, manifest_path=manifest_path)
+
+    assert registry_snapshot() == cold_snapshot
+
+
+def test_lazy_manifest_restore_indexes_inputs(router, tmp_path):
+    manifest_path = str(tmp_path / "manifest.json")
+    RouteRegistry.reset()
+    FlashRouter(router.app, manifest_path=manifest_path)
+    consumers = {node.node_id for node in RouteRegistry.get_input_consumers(["team_id"])}
+    assert consumers
+
+    RouteRegistry.reset()
+    FlashRouter(router.app, manifest_path=manifest_path, lazy_imports=True)
+
+    assert RouteRegistry.unloaded_nodes()
+    assert {node.node_id for node in RouteRegistry.get_input_consumers(["team_id"])} == consumers
+
+
+def test_fingerprint_tracks_route_files(tmp_path):
+    page = tmp_path / "page.py"
+    page.write_text("layout = None\n")
+    (tmp_path / "__pycache__").mkdir()
+    fingerprint = pages_fingerprint(str(tmp_path))
+
+    (tmp_path / "__pycache__" / "page.pyc").write_text("")
+    assert pages_fingerprint(str(tmp_path)) == fingerprint
+
+    stat = page.stat()
+    os.utime(page, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000))
+    assert pages_fingerprint(str(tmp_path)) != fingerprint
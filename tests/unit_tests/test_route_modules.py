@@ -0,0 +1,71 @@
+import builtins
+import sys
+
+from flash_router import FlashRouter
+from flash_router.core.modules import RouteModuleCache
+from flash_router.core.routing import RouteRegistry
+
+
+def write_page(tmp_path, name="page.py"):
+    page = tmp_path / name
+    page.write_text(
+        "import builtins\n"
+        "builtins.route_module_runs = getattr(builtins, 'route_module_runs', 0) + 1\n"
+        "config = None\n"
+        "def layout(**kwargs):\n"
+        "    return 'page'\n"
+    )
+    return page
+
+
+def test_route_module_executes_once(tmp_path, monkeypatch):
+    monkeypatch.setattr(builtins, "route_module_runs", 0, raising=False)
+    page = write_page(tmp_path)
+    cache = RouteModuleCache()
+
+    config_module = cache.load("pages.cached.page", str(page))
+    layout_module = cache.load("pages.cached.page", str(page))
+
+    assert config_module is layout_module
+    assert builtins.route_module_runs == 1
+    assert str(page) in cache
+    sys.modules.pop("pages.cached.page", None)
+
+
+def test_route_module_reuses_sys_modules(tmp_path, monkeypatch):
+    monkeypatch.setattr(builtins, "route_module_runs", 0, raising=False)
+    page = write_page(tmp_path)
+    first = RouteModuleCache().load("pages.shared.page", str(page))
+    second = RouteModuleCache().load("pages.shared.page", str(page))
+
+    assert first is second
+    assert builtins.route_module_runs == 1
+    sys.modules.pop("pages.shared.page", None)
+
+
+def test_parallel_preload_keeps_registration_order(router):
+    sequential_ids = list(RouteRegistry._nodes)
+    RouteRegistry.reset()
+
+    parallel_router = FlashRouter(router.app, import_workers=4)
+
+    assert list(RouteRegistry._nodes) == sequential_ids
+    assert len(parallel_router.route_modules) >= len(sequential_ids)
+
+
+def test_preload_reports_slowest_imports(router, tmp_path, monkeypatch):
+    slow = tmp_path / "slow_page.py"
+    slow.write_text("import time\ntime.sleep(0.05)\n")
+    fast = tmp_path / "fast_page.py"
+    fast.write_text("layout = None\n")
+    messages = []
+    monkeypatch.setattr(router.app.logger, "info", lambda message, *args: messages.append(message % args))
+    monkeypatch.setattr(sys, "modules", dict(sys.modules))
+
+    router.route_modules.clear()
+    router.import_workers = 2
+    slowest = router.preload_route_modules([str(fast), str(slow)])
+
+    assert [path for path, _ in slowest] == [str(slow), str(fast)]
+    assert slowest[0][1] >= 0.05
+    assert messages[0].index("slow_page.py") < messages[0].index("fast_page.py")
@@ -0,0 +1,41 @@
+from dataclasses import FrozenInstanceError
+
+import pytest
+
+from flash_router.core.routing import RouteRegistry
+from utils.helpers import get_node_by_path
+
+
+def test_compiled_nodes_are_linked(router):
+    ticket_node = RouteRegistry.get_node("tickets/[ticket-id]")
+    tickets_node = RouteRegistry.get_node("tickets")
+
+    assert ticket_node.parent is tickets_node
+    assert tickets_node.path_template is ticket_node
+    assert set(ticket_node.slots) == {"detail", "activity"}
+    assert ticket_node.slots["detail"].parent is ticket_node
+    assert ticket_node.is_path_template and not ticket_node.is_slot
+
+
+def test_compiled_segment_keys_match_page_nodes(router):
+    for path in ("tickets", "tickets/[ticket_id]", "files/[__rest]"):
+        page_node = get_node_by_path(path)
+        route_node = RouteRegistry.get_node(page_node.node_id)
+
+        for var in (None, "", "1001"):
+            assert route_node.create_segment_key(var) == page_node.create_segment_key(var)
+
+
+def test_compiled_nodes_are_immutable(router):
+    node = RouteRegistry.get_node("tickets")
+
+    with pytest.raises(FrozenInstanceError):
+        node.layout = None
+
+
+def test_input_index_lists_consumers(router):
+    team_node = RouteRegistry.get_node("projects/[team-id]")
+
+    assert RouteRegistry.get_input_consumers(["team_id"]) == [team_node]
+    assert RouteRegistry.get_input_consumers(["team_id", "unknown"]) == [team_node]
+    assert RouteRegistry.get_input_consumers(["unknown"]) == []
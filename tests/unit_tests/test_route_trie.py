@@ -0,0 +1,101 @@
+from dash import html
+
+from flash_router.core.matching import RouteTrie
+from flash_router.core.routing import PageNode, RouteRegistry, RoutingContext
+
+
+def make_node(path, parent=None):
+    segment = path.rsplit("/", 1)[-1]
+    return PageNode(
+        _segment=segment,
+        node_id=path,
+        layout=html.Div(path),
+        module=path.replace("/", "."),
+        path=path,
+        parent_id=parent.node_id if parent else None,
+        is_root=parent is not None and parent.path == "/",
+    )
+
+
+def register_module_tree():
+    index = make_node("/")
+    index.is_static = True
+    RouteRegistry.register_node(index, None)
+
+    # "sales" and "sales/module/archive" are empty organisational folders
+    reports = make_node("sales/module/reports", index)
+    RouteRegistry.register_node(reports, index)
+    detail = make_node("sales/module/reports/archive/[report-id]", reports)
+    RouteRegistry.register_node(detail, reports)
+    return reports, detail
+
+
+def stack(*segments):
+    return list(reversed(segments))
+
+
+def test_trie_multi_segment_key():
+    reports = make_node("sales/module/reports")
+    trie = RouteTrie()
+    trie.add("sales/module/reports", reports)
+
+    assert trie.match(stack("sales", "module", "reports", "2024")) == (reports, 3)
+    assert trie.match(stack("sales", "module")) == (None, 0)
+    assert trie.match(stack("reports")) == (None, 0)
+    assert trie.match(stack("sales", "module", "reports", "2024"), top=3) == (None, 0)
+
+
+def test_trie_route_precedes_template():
+    settings = make_node("users/settings")
+    user = make_node("users/[user-id]")
+    trie = RouteTrie()
+    trie.add("settings", settings)
+    trie.add("[user-id]", user)
+
+    assert trie.match(stack("settings")) == (settings, 1)
+    assert trie.match(stack("alice")) == (user, 0)
+    assert trie.match(stack()) == (user, 0)
+
+
+def test_trie_template_behind_prefix():
+    detail = make_node("reports/archive/[report-id]")
+    trie = RouteTrie()
+    trie.add("archive/[report-id]", detail)
+
+    assert trie.match(stack("archive", "17")) == (detail, 1)
+
+
+def test_empty_folders_are_part_of_the_url():
+    reports, detail = register_module_tree()
+    RouteRegistry.compile(ignore_empty_folders=False)
+
+    ctx = RoutingContext.from_request(
+        pathname="/sales/module/reports/archive/17",
+        query_params={},
+        loading_state_dict={},
+        resolve_type="url",
+    )
+    active_node = RouteRegistry.get_active_root_node(ctx, ignore_empty_folders=False)
+
+    assert active_node.node_id == reports.node_id
+    child_node, consumed = active_node.match_child(ctx.segments)
+    assert child_node.node_id == detail.node_id
+    assert consumed == 1
+
+
+def test_ignored_empty_folders_are_skipped():
+    reports, detail = register_module_tree()
+
+    ctx = RoutingContext.from_request(
+        pathname="/reports/17",
+        query_params={},
+        loading_state_dict={},
+        resolve_type="url",
+    )
+    active_node = RouteRegistry.get_active_root_node(ctx, ignore_empty_folders=True)
+
+    assert active_node.node_id == reports.node_id
+    child_node, consumed = active_node.match_child(ctx.segments)
+    assert child_node.node_id == detail.node_id
+    assert consumed == 0
+    assert ctx.segments == stack("17")
@@ -0,0 +1,113 @@
+import asyncio
+import json
+from pathlib import Path
+
+from flash import Flash
+
+from flash_router import FlashRouter, RootContainer
+from flash_router.components import LacyContainer
+
+
+def create_app():
+    # Routers passed to Flash set up their callbacks before the server copies them
+    app = Flash(
+        __name__,
+        prevent_initial_callbacks=True,
+        pages_folder=str(Path(__file__).resolve().parents[1] / "pages"),
+        use_pages=False,
+        router=FlashRouter,
+    )
+    app.layout = RootContainer()
+    return app
+
+
+def record_navigations(monkeypatch):
+    calls = []
+    resolve_navigation = FlashRouter.resolve_navigation
+
+    async def recording(self, *args):
+        calls.append(args)
+        return await resolve_navigation(self, *args)
+
+    monkeypatch.setattr(FlashRouter, "resolve_navigation", recording)
+    return calls
+
+
+def post_callback(app, output, outputs, inputs, state, changed_prop_id):
+    async def post():
+        async with app.server.test_app() as test_app:
+            client = test_app.test_client()
+            response = await client.post(
+                "/_dash-update-component",
+                json={
+                    "output": output,
+                    "outputs": outputs,
+                    "inputs": inputs,
+                    "state": state,
+                    "changedPropIds": [changed_prop_id],
+                },
+            )
+            return response.status_code, json.loads(await response.get_data())
+
+    return asyncio.run(post())
+
+
+def location_values(pathname, search=""):
+    return [
+        {"id": RootContainer.ids.location, "property": "pathname", "value": pathname},
+        {"id": RootContainer.ids.location, "property": "search", "value": search},
+    ]
+
+
+def test_hook_ignores_unrelated_requests(router):
+    async def post_upload():
+        client = router.app.server.test_client()
+        response = await client.post("/upload", data=b"\x00binary payload")
+        return response.status_code
+
+    # The body is never decoded, the request reaches routing untouched
+    assert asyncio.run(post_upload()) == 405
+
+
+def test_hook_skips_callbacks_not_triggered_by_location(monkeypatch):
+    app = create_app()
+    navigations = record_navigations(monkeypatch)
+    lacy_id = LacyContainer.ids.container("nested-route/child-3/(slot-31)")
+
+    # The lacy callback only reads the location as state, it is left to Dash
+    status, _ = post_callback(
+        app,
+        json.dumps(LacyContainer.ids.container(["MATCH"]), separators=(",", ":")) + ".children",
+        {"id": lacy_id, "property": "children"},
+        [
+            {"id": lacy_id, "property": "id", "value": lacy_id},
+            {"id": lacy_id, "property": "data-path", "value": "{}"},
+        ],
+        [
+            *location_values("/nested-route/child-3"),
+            {"id": RootContainer.ids.state_store, "property": "data", "value": {}},
+        ],
+        json.dumps(lacy_id, separators=(",", ":")) + ".id",
+    )
+
+    assert status == 200
+    assert navigations == []
+
+
+def test_hook_resolves_location_callbacks(monkeypatch):
+    app = create_app()
+    navigations = record_navigations(monkeypatch)
+
+    status, body = post_callback(
+        app,
+        f"{RootContainer.ids.dummy}.id",
+        {"id": RootContainer.ids.dummy, "property": "id"},
+        location_values("/tickets"),
+        [{"id": RootContainer.ids.state_store, "property": "data", "value": {}}],
+        f"{RootContainer.ids.location}.pathname",
+    )
+
+    assert status == 200
+    assert [call[:2] for call in navigations] == [("pathname", "/tickets")]
+    assert body["multi"] is True
+    assert RootContainer.ids.container in body["response"]
@@ -0,0 +1,43 @@
+import pytest
+from pydantic import ValidationError
+
+from flash_router.core.routing import LoadingState, RoutingContext
+
+
+def test_loading_states_are_plain_objects():
+    ctx = RoutingContext.from_request(
+        pathname="/tickets/1001",
+        query_params={},
+        loading_state_dict={"tickets": {"state": "done", "node_id": "tickets"}},
+        resolve_type="url",
+    )
+
+    assert ctx.loading_states == {"tickets": LoadingState("done", "tickets")}
+    assert ctx.get_updated_loading_state() == {}
+
+
+def test_strict_mode_validates_loading_states():
+    with pytest.raises(ValidationError):
+        RoutingContext.from_request(
+            pathname="/tickets",
+            query_params={},
+            loading_state_dict={"tickets": {"state": "unknown", "node_id": "tickets"}},
+            resolve_type="url",
+            strict=True,
+        )
+
+
+def test_variables_are_replaced_on_update():
+    ctx = RoutingContext.from_request(
+        pathname="/tickets/1001",
+        query_params={"page": 2, "ticket_id": "query"},
+        loading_state_dict={},
+        resolve_type="url",
+    )
+    before = ctx.variables
+
+    ctx.set_path_var("ticket_id", "1001")
+
+    assert before == {"page": 2, "ticket_id": "query"}
+    assert ctx.variables == {"page": 2, "ticket_id": "1001"}
+    assert ctx.variables is ctx.variables
@@ -0,0 +1,113 @@
+import base64
+import dataclasses
+import datetime
+import decimal
+import enum
+import json
+
+import pytest
+from dash import dcc, html
+
+from flash_router.utils.serialization import dumps, to_json_compatible
+
+
+class Color(str, enum.Enum):
+    RED = "red"
+
+
+class Status(enum.Enum):
+    OPEN = 1
+
+
+@dataclasses.dataclass
+class Ticket:
+    ticket_id: str
+    status: Status
+    tags: list[str]
+    due: datetime.date
+
+
+def test_component_tree_is_encoded_once():
+    layout = html.Div(
+        [html.H1("Title", id={"type": "title", "index": 1}), dcc.Store(id="store", data={"n": 1})],
+        style={"color": Color.RED},
+    )
+
+    encoded = json.loads(dumps({"container": {"children": layout}}))
+    children = encoded["container"]["children"]
+
+    assert children["type"] == "Div"
+    assert children["props"]["style"] == {"color": "red"}
+    assert children["props"]["children"][0]["props"]["id"] == {"type": "title", "index": 1}
+    assert children["props"]["children"][1]["props"]["data"] == {"n": 1}
+    assert encoded == to_json_compatible({"container": {"children": layout}})
+
+
+def test_special_values_keep_their_output():
+    values = [
+        decimal.Decimal("1.25"),
+        datetime.date(2024, 1, 2),
+        datetime.datetime(2024, 1, 2, 3, 4, 5),
+        (1, "a"),
+        {1, 2},
+    ]
+
+    assert json.loads(dumps(values)) == [1.25, "2024-01-02", "2024-01-02T03:04:05", [1, "a"], "{1, 2}"]
+    assert to_json_compatible(values) == json.loads(dumps(values))
+
+
+def test_numpy_and_pandas_values():
+    np = pytest.importorskip("numpy")
+    pd = pytest.importorskip("pandas")
+
+    values = [np.array([[1, 2], [3, 4]]), np.int64(3), np.bool_(True), pd.Timestamp("2024-01-01"), pd.NaT]
+
+    assert json.loads(dumps(values)) == [[[1, 2], [3, 4]], 3, True, "2024-01-01T00:00:00", None]
+    assert to_json_compatible(values) == json.loads(dumps(values))
+
+
+def test_figure_arrays_are_sent_as_typed_arrays():
+    np = pytest.importorskip("numpy")
+    pd = pytest.importorskip("pandas")
+
+    values = np.arange(300, dtype="float64")
+    figure = {
+        "data": [{"type": "scatter", "x": pd.Series(np.arange(300)), "y": values, "text": np.arange(3)}],
+        "layout": {"xaxis": {"range": np.array([0.0, 300.0])}},
+    }
+    graph = dcc.Graph(id="graph", figure=figure)
+
+    trace = json.loads(dumps(graph, typed_array_threshold=256))["props"]["figure"]["data"][0]
+
+    assert trace["y"]["dtype"] == "f8"
+    assert np.array_equal(np.frombuffer(base64.b64decode(trace["y"]["bdata"])), values)
+    assert trace["x"]["dtype"] == "i2"
+    assert trace["text"] == [0, 1, 2]
+    assert json.loads(json.dumps(to_json_compatible(graph))) == json.loads(dumps(graph))
+    assert json.loads(dumps(graph))["props"]["figure"]["data"][0]["y"] == values.tolist()
+    # Arrays outside of figures keep their plain encoding
+    store = dcc.Store(id="store", data=values)
+    assert json.loads(dumps(store, typed_array_threshold=256))["props"]["data"] == values.tolist()
+
+
+def test_enums_and_dataclasses_match_orjson():
+    orjson = pytest.importorskip("orjson")
+    ticket = Ticket("1001", Status.OPEN, ["bug"], datetime.date(2024, 1, 2))
+    value = {"ticket": ticket, "tickets": [ticket], "status": Status.OPEN}
+
+    native = json.loads(orjson.dumps(value))
+
+    assert to_json_compatible(value) == native
+    assert json.loads(dumps(value)) == native
+
+
+def test_deeply_nested_layout_is_encoded():
+    layout = html.Div("leaf")
+    for _ in range(150):
+        layout = html.Div(layout)
+
+    encoded = json.loads(dumps(layout))
+
+    for _ in range(150):
+        encoded = encoded["props"]["children"]
+    assert encoded["props"]["children"] == "leaf"
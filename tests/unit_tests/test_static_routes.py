@@ -0,0 +1,80 @@
+from dash import html
+
+from flash_router.core.matching import StaticRouteMatcher
+from flash_router.core.routing import PageNode, RouteRegistry, RoutingContext
+
+
+def make_static_node(path):
+    return PageNode(
+        _segment=path,
+        node_id=path,
+        layout=html.Div(path),
+        module=path.replace("/", "."),
+        path=path,
+        is_static=True,
+    )
+
+
+def test_static_literal_route():
+    about = make_static_node("about")
+    matcher = StaticRouteMatcher([about])
+
+    assert matcher.match("about") == (about, {})
+    assert matcher.match("/about/") == (about, {})
+    assert matcher.match("about/team") == (None, {})
+
+
+def test_static_path_template_variables():
+    user = make_static_node("users/[user-id]/posts/[post-id]")
+    matcher = StaticRouteMatcher([user])
+
+    node, variables = matcher.match("users/42/posts/7")
+
+    assert node is user
+    assert variables == {"user_id": "42", "post_id": "7"}
+
+
+def test_static_literal_precedes_template():
+    settings = make_static_node("users/settings")
+    user = make_static_node("users/[user-id]")
+    matcher = StaticRouteMatcher([user, settings])
+
+    assert matcher.match("users/settings") == (settings, {})
+    assert matcher.match("users/alice") == (user, {"user_id": "alice"})
+
+
+def test_static_template_backtracks_to_sibling():
+    report = make_static_node("reports/daily/summary")
+    detail = make_static_node("reports/[report-id]/detail")
+    matcher = StaticRouteMatcher([report, detail])
+
+    assert matcher.match("reports/daily/detail") == (detail, {"report_id": "daily"})
+
+
+def test_static_catch_all():
+    docs = make_static_node("docs/[--rest]")
+    matcher = StaticRouteMatcher([docs])
+
+    assert matcher.match("docs") == (docs, {"rest": []})
+    assert matcher.match("docs/a/b") == (docs, {"rest": ["a", "b"]})
+
+
+def test_registry_static_route_lookup(router):
+    ctx = RoutingContext.from_request(
+        pathname="",
+        query_params={},
+        loading_state_dict={},
+        resolve_type="url",
+    )
+    index_node, path_variables = RouteRegistry.get_static_route(ctx)
+
+    assert index_node.node_id == "/"
+    assert path_variables == {}
+
+    ctx = RoutingContext.from_request(
+        pathname="tickets/1001",
+        query_params={},
+        loading_state_dict={},
+        resolve_type="url",
+    )
+    assert RouteRegistry.get_static_route(ctx) == (None, {})
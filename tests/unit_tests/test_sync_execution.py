@@ -0,0 +1,130 @@
+import asyncio
+import contextvars
+import inspect
+import json
+import os
+import threading
+
+from dash import html
+from flash._pages import _infer_module_name
+from pydantic import BaseModel
+
+from flash_router import RootContainer
+from flash_router.core.executors import SyncExecutor
+from flash_router.core.routing import RouteRegistry, _bind
+
+
+class Ticket(BaseModel):
+    ticket_id: str
+    thread: str
+
+
+def test_thread_mode_runs_off_the_event_loop():
+    executor = SyncExecutor(max_workers=2)
+    request_id = contextvars.ContextVar("request_id")
+
+    def layout(name: str):
+        return html.Div(f"{name} {request_id.get()} {threading.current_thread().name}")
+
+    wrapped = executor.wrap(layout, "thread")
+
+    async def render():
+        request_id.set("r-1")
+        return await wrapped(name="detail")
+
+    div = asyncio.run(render())
+    executor.shutdown()
+
+    assert inspect.iscoroutinefunction(wrapped)
+    assert inspect.signature(wrapped) == inspect.signature(layout)
+    assert div.children.startswith("detail r-1 flash-router")
+
+
+def test_inline_mode_only_wraps_endpoints():
+    executor = SyncExecutor()
+
+    def layout():
+        return html.Div()
+
+    async def async_endpoint():
+        return None
+
+    assert executor.wrap(layout, "inline") is layout
+    assert executor.wrap(async_endpoint, "thread", awaitable=True) is async_endpoint
+    assert inspect.iscoroutinefunction(executor.wrap(layout, "inline", awaitable=True))
+
+
+def test_sync_layouts_run_inline_by_default(router):
+    def layout():
+        return html.Div(threading.current_thread().name)
+
+    assert router.sync_execution == "inline"
+    assert router.sync_executor.wrap(layout, router.sync_execution) is layout
+
+
+def test_sync_endpoint_is_awaited_on_the_pool(router):
+    results = []
+
+    def endpoint(ticket_id: str, **kwargs):
+        return Ticket(ticket_id=ticket_id, thread=threading.current_thread().name)
+
+    def layout(data: Ticket = None, **kwargs):
+        results.append(data)
+        return html.Div(data.ticket_id)
+
+    _bind(
+        RouteRegistry.get_node("tickets/[ticket-id]/(detail)"),
+        endpoint=router.sync_executor.wrap(endpoint, "thread", awaitable=True),
+        layout=router.sync_executor.wrap(layout, "thread"),
+    )
+
+    asyncio.run(router.resolve_url("/tickets/1001", {}, {}))
+
+    assert results[0].ticket_id == "1001"
+    assert results[0].thread.startswith("flash-router")
+
+
+def test_process_mode_splices_rendered_containers(router):
+    node = RouteRegistry.get_node("nested-route")
+    page_path = os.path.join(router.pages_folder, "nested_route", "page.py")
+    inline = asyncio.run(router.resolve_url("/nested-route/child-1", {}, {})).to_json()
+
+    RouteRegistry.reset()
+    router.setup_route_tree()
+    node = RouteRegistry.get_node("nested-route")
+    _bind(
+        node,
+        layout=router.sync_executor.wrap_process(node.layout, [(_infer_module_name(page_path), page_path)]),
+    )
+    try:
+        in_process = asyncio.run(router.resolve_url("/nested-route/child-1", {}, {})).to_json()
+    finally:
+        router.sync_executor.shutdown()
+
+    assert json.loads(in_process) == json.loads(inline)
+
+
+def test_lacy_layout_rendered_in_process_is_plain_json(router):
+    node_id = "nested-route/child-3/(slot-31)"
+    page_path = os.path.join(router.pages_folder, "nested_route", "child_3", "(slot_31)", "page.py")
+    response = json.loads(asyncio.run(router.resolve_url("/nested-route/child-3", {}, {})).to_json())
+    loading_state = response["response"][RootContainer.ids.state_store]["data"]
+
+    def load(node_id):
+        return asyncio.run(
+            router.resolve_lacy(node_id, "{}", "/nested-route/child-3", "", dict(loading_state))
+        )
+
+    inline = load(node_id)
+    node = RouteRegistry.get_node(node_id)
+    _bind(
+        node,
+        layout=router.sync_executor.wrap_process(node.layout, [(_infer_module_name(page_path), page_path)]),
+    )
+    try:
+        in_process = load(node_id)
+    finally:
+        router.sync_executor.shutdown()
+
+    # Lacy layouts go through the callback serializer of Dash
+    assert json.dumps(in_process) == json.dumps(inline)
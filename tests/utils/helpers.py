@@ -2,12 +2,11 @@ import json
 from pathlib import Path
 
 import pytest
-from dash._utils import AttributeDict
 from dash.development.base_component import Component
 from flash import Flash
 
 from flash_router import FlashRouter
-from flash_router.core.routing import PageNode, RouteTable, RouteTree
+from flash_router.core.routing import PageNode, RouteRegistry
 from flash_router.utils.helper_functions import format_relative_path
 
 
@@ -31,20 +30,20 @@ def serialize_value(value):
 
 
 def serialize_route_table():
-    return {key: serialize_value(node) for key, node in RouteTable._table.items()}
+    return {key: serialize_value(node) for key, node in RouteRegistry._nodes.items()}
 
 
 def serialize_route_tree():
-    dynamic_routes = RouteTree._dynamic_routes
+    dynamic_routes = RouteRegistry._dynamic_root
     return serialize_value(
         {
-            "static": RouteTree._static_routes,
+            "static": RouteRegistry._static_root,
             "dynamic": {
                 "routes": {
-                    segment: RouteTable.get_node(node_id)
+                    segment: RouteRegistry._nodes.get(node_id)
                     for segment, node_id in dynamic_routes.routes.items()
                 },
-                "path_template": RouteTable.get_node(dynamic_routes.path_template)
+                "path_template": RouteRegistry._nodes.get(dynamic_routes.path_template)
                 if dynamic_routes.path_template
                 else None,
             },
@@ -76,7 +75,7 @@ def done_state(node, next_segment):
 
 def get_node_by_path(path):
     formatted_path = format_relative_path(path)
-    for node in RouteTable._table.values():
+    for node in RouteRegistry._nodes.values():
         if node.path == formatted_path:
             return node
     return None
@@ -84,12 +83,16 @@ def get_node_by_path(path):
 
 @pytest.fixture(autouse=True)
 def reset_route_state():
-    RouteTable._table = {}
-    RouteTree._static_routes = {}
-    RouteTree._dynamic_routes = AttributeDict(routes={}, path_template=None)
+    RouteRegistry.reset()
     yield
 
 
+@pytest.fixture(autouse=True)
+def isolated_working_directory(tmp_path, monkeypatch):
+    """Routers write their navigation stubs into the working directory"""
+    monkeypatch.chdir(tmp_path)
+
+
 @pytest.fixture()
 def router():
     pages_dir = Path(__file__).resolve().parents[1] / "pages"